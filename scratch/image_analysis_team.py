@@ -8,6 +8,7 @@ This module implements a coordinate mode team with two agents:
 The goal is to test when and how images are accessible to sub-agents.
 """
 
+import asyncio
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +25,11 @@ from loguru import logger
 class ImageAnalysisTeam:
     """Coordinate mode team for testing image accessibility between agents."""
 
+    #: Whether independent requests may run concurrently on one instance. The
+    #: underlying agno Team and the current session id are shared mutable state,
+    #: so callers must serialize requests unless this is True.
+    supports_concurrent = False
+
     def __init__(
         self,
         storage_path: Path | None = None,
@@ -353,6 +359,18 @@ Each agent should report:
 
         return response
 
+    async def analyze_with_image_async(self, text: str, image_path: str | None = None, session_id: str | None = None):
+        """Async wrapper around analyze_with_image that runs it in a worker thread."""
+        return await asyncio.to_thread(self.analyze_with_image, text, image_path, session_id)
+
+    async def analyze_with_png_files_async(self, text: str, png_dir: str = "tmp", session_id: str | None = None):
+        """Async wrapper around analyze_with_png_files that runs it in a worker thread."""
+        return await asyncio.to_thread(self.analyze_with_png_files, text, png_dir, session_id)
+
+    async def ask_async(self, query: str, session_id: str | None = None):
+        """Async wrapper around ask that runs it in a worker thread."""
+        return await asyncio.to_thread(self.ask, query, session_id)
+
 
 # Example usage and testing
 if __name__ == "__main__":
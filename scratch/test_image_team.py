@@ -6,6 +6,7 @@ This script demonstrates how to use the ImageAnalysisTeam to test
 image accessibility between agents.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -15,65 +16,70 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from scratch.image_analysis_team import ImageAnalysisTeam
 
 
-def main():
-    """Main test function."""
-    print("🔍 Testing Image Analysis Team - Image Accessibility Test\n")
-
-    # Create team instance
-    team = ImageAnalysisTeam(work_dir=Path("tmp/image_test_work"), user_id="test_user")
-
-    # Test 1: Analysis without image
+def report(title, response=None, error=None):
+    """Print the outcome of a single test."""
     print("=" * 60)
-    print("Test 1: Analysis without image")
+    print(title)
     print("=" * 60)
-
-    try:
-        response1 = team.analyze_with_image(
-            "Hello, this is a test message without an image. Please analyze this text and "
-            "report on image accessibility."
-        )
+    if error is not None:
+        print(f"❌ Error in {title.split(':')[0]}: {error}")
+    else:
         print("✅ Team Response:")
-        print(response1.content)
-        print("\n")
-    except Exception as e:
-        print(f"❌ Error in Test 1: {e}")
-        print("\n")
+        print(response.content)
+    print("\n")
 
-    # Test 2: Analysis with PNG files from tmp directory
-    print("=" * 60)
-    print("Test 2: Analysis with PNG files from tmp directory")
-    print("=" * 60)
 
-    try:
-        response2 = team.analyze_with_png_files(
-            "Please analyze the PNG images found in the tmp directory. Focus on reporting "
-            "image accessibility timing and which agents can see which images."
-        )
-        print("✅ Team Response:")
-        print(response2.content)
-        print("\n")
-    except Exception as e:
-        print(f"❌ Error in Test 2: {e}")
-        print("\n")
+async def main():
+    """Main test function."""
+    print("🔍 Testing Image Analysis Team - Image Accessibility Test\n")
 
-    # Test 3: Follow-up question in the same session
-    print("=" * 60)
-    print("Test 3: Follow-up question")
-    print("=" * 60)
+    # Create team instance
+    team = ImageAnalysisTeam(work_dir=Path("tmp/image_test_work"), user_id="test_user")
 
+    test1_title = "Test 1: Analysis without image"
+    test1 = (
+        "Hello, this is a test message without an image. Please analyze this text and report on image accessibility."
+    )
+    test2_title = "Test 2: Analysis with PNG files from tmp directory"
+    test2 = (
+        "Please analyze the PNG images found in the tmp directory. Focus on reporting "
+        "image accessibility timing and which agents can see which images."
+    )
+
+    # Tests 1 and 2 are independent LLM round-trips, so overlap them when the
+    # team can serve concurrent requests (each in its own session)
+    if team.supports_concurrent:
+        results = await asyncio.gather(
+            team.analyze_with_image_async(test1, session_id=team.create_session()),
+            team.analyze_with_png_files_async(test2, session_id=team.create_session()),
+            return_exceptions=True,
+        )
+        for title, result in zip((test1_title, test2_title), results, strict=True):
+            if isinstance(result, Exception):
+                report(title, error=result)
+            else:
+                report(title, result)
+    else:
+        for title, run in (
+            (test1_title, lambda: team.analyze_with_image_async(test1)),
+            (test2_title, lambda: team.analyze_with_png_files_async(test2)),
+        ):
+            try:
+                report(title, await run())
+            except Exception as e:
+                report(title, error=e)
+
+    # Test 3: Follow-up question in the same session, so it must run last
     try:
-        response3 = team.ask(
+        response3 = await team.ask_async(
             "Based on our previous interactions, can you summarize what you learned about image accessibility timing?"
         )
-        print("✅ Team Response:")
-        print(response3.content)
-        print("\n")
+        report("Test 3: Follow-up question", response3)
     except Exception as e:
-        print(f"❌ Error in Test 3: {e}")
-        print("\n")
+        report("Test 3: Follow-up question", error=e)
 
     print("🎉 Test completed!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,14 +3,49 @@
 Test script to debug JUnit XML parsing error.
 """
 
+import itertools
 import os
 import sys
-import xml.etree.ElementTree as ET
 
 # Add sidekick to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from sidekick.tools.test_analysis import storage_client
+from google.api_core.exceptions import NotFound
+
+from sidekick.utils._xml import ET, fromstring
+from sidekick.utils.storage import storage_client
+
+
+def preview(text, limit=500):
+    """Return a repr of text, truncated so huge single-line blobs stay cheap to print."""
+    if len(text) <= limit:
+        return repr(text)
+    return f"{text[:limit]!r}... ({len(text)} chars)"
+
+
+def sniff_xml_head(xml_path):
+    """Check the first bytes of a blob and report obviously non-XML content.
+
+    The ranged read doubles as the existence check, so no separate
+    blob_exists() round-trip is needed.
+
+    Returns True if the blob looks like XML and is worth downloading in full.
+    """
+    try:
+        head = storage_client.get_bytes_range(xml_path, 0, 4)
+    except NotFound:
+        print("❌ File does not exist")
+        return False
+    if head.startswith(b"\xef\xbb\xbf"):
+        print("❌ File has BOM (Byte Order Mark)")
+        return False
+    if head[0:1] == b"\x00":
+        print("❌ File appears to be binary")
+        return False
+    if head[0:1] != b"<":
+        print(f"❌ File doesn't start with '<' - not XML (head: {head!r})")
+        return False
+    return True
 
 
 def test_junit_xml_parsing():
@@ -24,17 +59,16 @@ def test_junit_xml_parsing():
     try:
         print(f"Testing JUnit XML file: {xml_path}")
 
-        # First, let's check if the file exists
-        exists = storage_client.blob_exists(xml_path)
-        print(f"File exists: {exists}")
-
-        if not exists:
-            print("❌ File does not exist")
+        # Sniff the first bytes before paying for the full download
+        if not sniff_xml_head(xml_path):
             return False
 
         # Get the raw content
         print("\nRetrieving raw content...")
-        raw_content = storage_client.get_text_from_blob(xml_path)
+        raw_content = storage_client.try_get_text(xml_path)
+        if raw_content is None:
+            print("❌ File does not exist")
+            return False
         print(f"Raw content length: {len(raw_content)} characters")
         print(f"First 200 characters: {repr(raw_content[:200])}")
         print(f"Last 200 characters: {repr(raw_content[-200:])}")
@@ -47,7 +81,7 @@ def test_junit_xml_parsing():
         # Try to parse as XML
         print("\nTrying to parse as XML...")
         try:
-            root = ET.fromstring(raw_content)
+            root = fromstring(raw_content)
             print(f"✅ Successfully parsed XML. Root tag: {root.tag}")
 
             # Check attributes
@@ -63,26 +97,25 @@ def test_junit_xml_parsing():
 
             # Check for failures
             for i, testsuite in enumerate(testsuites):
-                failures = int(testsuite.get("failures", "0"))
-                errors = int(testsuite.get("errors", "0"))
-                tests = int(testsuite.get("tests", "0"))
-                name = testsuite.get("name", "Unknown")
+                attrs = testsuite.attrib
+                failures = int(attrs.get("failures") or 0)
+                errors = int(attrs.get("errors") or 0)
+                tests = int(attrs.get("tests") or 0)
+                name = attrs.get("name", "Unknown")
 
                 print(f"Testsuite {i + 1}: {name}")
                 print(f"  Tests: {tests}, Failures: {failures}, Errors: {errors}")
 
-                if failures > 0 or errors > 0:
-                    print(f"  ⚠️  Found {failures} failures and {errors} errors")
-
-                    # Look for failure elements
-                    failure_elements = testsuite.findall(".//failure")
-                    error_elements = testsuite.findall(".//error")
+                if failures == 0 and errors == 0:
+                    continue
 
-                    print(f"  Failure elements: {len(failure_elements)}")
-                    print(f"  Error elements: {len(error_elements)}")
+                print(f"  ⚠️  Found {failures} failures and {errors} errors")
 
-                    for j, failure in enumerate(failure_elements[:2]):  # Show first 2 failures
-                        print(f"    Failure {j + 1}: {failure.get('message', 'No message')[:100]}...")
+                # Only walk the subtree as far as needed for the first 2 of each
+                for j, failure in enumerate(itertools.islice(testsuite.iter("failure"), 2)):
+                    print(f"    Failure {j + 1}: {failure.get('message', 'No message')[:100]}...")
+                for j, error in enumerate(itertools.islice(testsuite.iter("error"), 2)):
+                    print(f"    Error {j + 1}: {error.get('message', 'No message')[:100]}...")
 
             return True
 
@@ -90,21 +123,12 @@ def test_junit_xml_parsing():
             print(f"❌ XML Parse Error: {e}")
 
             # Try to find the problematic area
-            lines = raw_content.split("\n")
-            print(f"Total lines: {len(lines)}")
+            print(f"Total lines: {raw_content.count(chr(10)) + 1}")
 
-            # Show first few lines
+            # Show first few lines without splitting the whole document
             print("\nFirst 10 lines:")
-            for i, line in enumerate(lines[:10], 1):
-                print(f"{i:2d}: {repr(line)}")
-
-            # If it's a syntax error at line 1, column 0, it might be a binary file or have BOM
-            if raw_content.startswith("\ufeff"):
-                print("❌ File has BOM (Byte Order Mark)")
-            elif raw_content.startswith(b"\x00".decode("utf-8", errors="ignore")):
-                print("❌ File appears to be binary")
-            elif not raw_content.startswith("<"):
-                print("❌ File doesn't start with '<' - not XML")
+            for i, line in enumerate(raw_content.split("\n", 10)[:10], 1):
+                print(f"{i:2d}: {preview(line)}")
 
             return False
 
@@ -125,20 +149,29 @@ def test_working_xml():
         print(f"\n{'=' * 80}")
         print(f"Testing working XML file: {xml_path}")
 
-        exists = storage_client.blob_exists(xml_path)
-        print(f"File exists: {exists}")
-
-        if not exists:
-            print("❌ File does not exist")
+        if not sniff_xml_head(xml_path):
             return False
 
-        raw_content = storage_client.get_text_from_blob(xml_path)
-        print(f"Raw content length: {len(raw_content)} characters")
-        print(f"First 200 characters: {repr(raw_content[:200])}")
-
-        # Parse XML
-        root = ET.fromstring(raw_content)
-        print(f"✅ Successfully parsed XML. Root tag: {root.tag}")
+        # Parse while downloading so network and parsing overlap
+        parser = ET.XMLPullParser(events=("start", "end"))
+        root = None
+        total_bytes = 0
+        testsuite_count = 0
+        for chunk in storage_client.iter_blob_chunks(xml_path):
+            total_bytes += len(chunk)
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = elem
+                elif elem.tag == "testsuite":
+                    testsuite_count += 1
+                    elem.clear()
+        parser.close()
+
+        print(f"Raw content length: {total_bytes} bytes")
+        print(f"✅ Successfully parsed XML. Root tag: {root.tag if root is not None else None}")
+        print(f"Found {testsuite_count} testsuites")
 
         return True
 
@@ -9,7 +9,8 @@ import sys
 # Add sidekick to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from sidekick.tools.test_analysis import get_test_analysis_prompt, storage_client
+from sidekick.utils.storage import storage_client
+from sidekick.utils.test_analysis import get_folder_structure
 
 
 def test_sidekick_gcs():
@@ -21,26 +22,23 @@ def test_sidekick_gcs():
     artifacts_dir = f"{base_dir}/artifacts/"
 
     try:
-        print(f"Testing get_immediate_directories for: {artifacts_dir}")
-        directories = storage_client.get_immediate_directories(artifacts_dir)
-        print(f"Found directories: {directories}")
-
-        e2e_dirs = [d for d in directories if d.startswith("e2e-tests-")]
+        print(f"Testing list_immediate_directories for: {artifacts_dir}")
+        e2e_dirs = storage_client.list_immediate_directories(artifacts_dir, "e2e-tests-")
         print(f"E2E test directories: {e2e_dirs}")
 
         if e2e_dirs:
             print("✅ Successfully found e2e test directories!")
 
-            # Now test the full prompt generation
-            print("\nTesting get_test_analysis_prompt...")
-            prompt = get_test_analysis_prompt(base_dir)
-            print(f"Generated prompt (first 500 chars): {prompt[:500]}...")
+            # Now test the artifact tree used to build the analysis context
+            print("\nTesting get_folder_structure...")
+            tree = get_folder_structure(base_dir)
+            print(f"Folder structure (first 500 chars): {tree[:500]}...")
 
-            if prompt and len(prompt) > 100:
-                print("✅ Successfully generated test analysis prompt!")
+            if tree and len(tree) > 100:
+                print("✅ Successfully generated artifact folder structure!")
                 return True
             else:
-                print(f"❌ Prompt too short or empty: {len(prompt)} characters")
+                print(f"❌ Folder structure too short or empty: {len(tree)} characters")
                 return False
         else:
             print("❌ No e2e test directories found")
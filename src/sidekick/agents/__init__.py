@@ -5,12 +5,16 @@ This module contains agent implementations for various AI-powered features
 including search and knowledge retrieval using the Agno framework.
 """
 
-from ..knowledge import KnowledgeManager
-from .base import BaseAgentFactory
-from .jira_agent import JiraAgent
-from .release_manager import ReleaseManagerAgent
-from .release_notes_agent import ReleaseNotesAgent
-from .search_agent import SearchAgent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..knowledge import KnowledgeManager
+    from .base import BaseAgentFactory
+    from .jira_agent import JiraAgent
+    from .release_manager import ReleaseManagerAgent
+    from .release_notes_agent import ReleaseNotesAgent
+    from .search_agent import SearchAgent
 
 __all__ = [
     "KnowledgeManager",
@@ -20,3 +24,20 @@ __all__ = [
     "ReleaseNotesAgent",
     "ReleaseManagerAgent",
 ]
+
+_EXPORTS = {
+    "KnowledgeManager": "..knowledge",
+    "BaseAgentFactory": ".base",
+    "SearchAgent": ".search_agent",
+    "JiraAgent": ".jira_agent",
+    "ReleaseNotesAgent": ".release_notes_agent",
+    "ReleaseManagerAgent": ".release_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Load agent modules on first use, so importing one agent (or the triager
+    # behind the CLI) does not pull in agno, the model SDKs and every toolkit.
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
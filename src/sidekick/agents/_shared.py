@@ -0,0 +1,60 @@
+"""
+Tool instances and helpers shared between agent factories in the same process.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory
+    from agno.tools.file import FileTools
+
+# Cheap model used to maintain the rolling session summary sent instead of
+# full prior runs
+SESSION_SUMMARY_MODEL_ID = "gemini-2.5-flash-lite"
+
+
+def new_session_id() -> str:
+    """Return a new random agent session ID (32 hex characters)."""
+    return uuid4().hex
+
+
+@lru_cache(maxsize=16)
+def get_file_tools(base_dir: str) -> "FileTools":
+    """Return the FileTools instance for a workspace directory.
+
+    Agents working on the same workspace share one instance.
+
+    Args:
+        base_dir: Workspace directory
+
+    Returns:
+        FileTools rooted at base_dir
+    """
+    from agno.tools.file import FileTools
+
+    return FileTools(base_dir=Path(base_dir))
+
+
+def with_session_summaries(memory: "Memory | None") -> "Memory":
+    """Return a Memory that can maintain session summaries.
+
+    A new Memory is created if none is given. A summarizer backed by
+    SESSION_SUMMARY_MODEL_ID is attached unless one is already configured.
+
+    Args:
+        memory: Memory instance passed to the agent factory, if any
+
+    Returns:
+        Memory instance with a session summarizer
+    """
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.summarizer import SessionSummarizer
+    from agno.models.google import Gemini
+
+    memory = memory or Memory()
+    if memory.summary_manager is None:
+        memory.summary_manager = SessionSummarizer(model=Gemini(id=SESSION_SUMMARY_MODEL_ID))
+    return memory
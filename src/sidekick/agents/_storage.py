@@ -0,0 +1,245 @@
+"""
+SQLite session storage shared by the agent factories.
+
+Agent storages are created once per database file and table and shared by
+every agent in the process; see get_shared_storage().
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from functools import cache
+from pathlib import Path
+
+from agno.storage.session import Session
+from agno.storage.sqlite import SqliteStorage
+from loguru import logger
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Connection-level PRAGMAs for agent session databases. WAL turns every
+# session upsert into an append to the write-ahead log instead of a full
+# fsync barrier, which dominates latency for chatty interactive sessions.
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -20000,  # ~20 MB page cache
+    "mmap_size": 134217728,  # 128 MB
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,  # ms
+}
+
+# Session rows are multi-KB JSON blobs; larger pages keep a typical row out of
+# overflow pages. Only takes effect when the database file is created.
+SQLITE_PAGE_SIZE = 32768
+
+# Connections kept open per database file and shared by all agent storages.
+# WAL lets these read concurrently while a single writer appends.
+SQLITE_POOL_SIZE = 4
+
+# Databases are created with incremental auto_vacuum; while sessions are being
+# written, up to SQLITE_VACUUM_PAGES free pages are returned to the OS every
+# SQLITE_VACUUM_INTERVAL seconds so the file does not grow monotonically.
+SQLITE_VACUUM_INTERVAL = 600
+SQLITE_VACUUM_PAGES = 256
+
+
+def _tune_sqlite(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection.
+
+    Registered as a SQLAlchemy ``connect`` listener so that every pooled
+    connection gets the same settings.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+@cache
+def _get_sqlite_engine(db_file: str) -> Engine:
+    """Return the process-wide engine, and so connection pool, for a database file."""
+    engine = create_engine(
+        f"sqlite:///{Path(db_file).resolve()}",
+        pool_size=SQLITE_POOL_SIZE,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", _tune_sqlite)
+    return engine
+
+
+def _init_sqlite_file(db_path: Path) -> None:
+    """Create an empty SQLite database with SQLITE_PAGE_SIZE pages and incremental auto_vacuum.
+
+    page_size cannot be changed once a database is in WAL mode, so it has to
+    be set before SqliteStorage opens the file for the first time.
+    """
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute(f"PRAGMA page_size={SQLITE_PAGE_SIZE}")
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    logger.debug(f"Initialized {db_path} with page_size={SQLITE_PAGE_SIZE}")
+
+
+class BatchingSqliteStorage(SqliteStorage):
+    """SqliteStorage that coalesces session upserts and writes them in the background.
+
+    Agents upsert their session several times per run. Upserts are buffered per
+    session and flushed by a background thread every ``flush_interval``
+    seconds, keeping the writes off the interactive path. Reads see buffered
+    sessions, and pending writes are flushed on close() and at interpreter exit.
+    """
+
+    def __init__(self, *args, flush_interval: float = 0.2, **kwargs):
+        """Initialize batching storage.
+
+        Args:
+            flush_interval: Seconds to collect upserts before writing them
+            *args: Passed to SqliteStorage
+            **kwargs: Passed to SqliteStorage
+        """
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._pending: dict[str, Session] = {}
+        self._pending_lock = threading.Lock()
+        # Re-entrant: SqliteStorage.upsert() calls read() while a flush holds it
+        self._flush_lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._last_vacuum = time.monotonic()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="storage-flush", daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.close)
+
+    def __deepcopy__(self, memo):
+        """Share the instance between agent copies so buffered writes stay in one place."""
+        memo[id(self)] = self
+        return self
+
+    def _flush_loop(self) -> None:
+        """Background loop writing buffered sessions shortly after they arrive."""
+        # close() may land while a flush is being collected; checking here stops the
+        # loop from waiting again on the wakeup it just cleared
+        while not self._closed:
+            self._wakeup.wait()
+            if self._closed:
+                return
+            time.sleep(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+            if time.monotonic() - self._last_vacuum >= SQLITE_VACUUM_INTERVAL:
+                self.incremental_vacuum()
+
+    def incremental_vacuum(self, pages: int = SQLITE_VACUUM_PAGES) -> None:
+        """Release up to ``pages`` free pages (no-op unless auto_vacuum is INCREMENTAL)."""
+        self._last_vacuum = time.monotonic()
+        try:
+            # The pragma frees one page per step, so drive it to completion on
+            # the DBAPI cursor; SQLAlchemy does not fetch description-less results
+            conn = self.db_engine.raw_connection()
+            try:
+                conn.cursor().execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.warning(f"Incremental vacuum of {self.table_name} failed: {e}")
+
+    def flush(self) -> None:
+        """Write all buffered sessions to the database."""
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            for session in pending.values():
+                try:
+                    super().upsert(session)
+                except Exception as e:
+                    logger.error(f"Error writing session {session.session_id}: {e}")
+            if pending:
+                logger.debug("Flushed {} session(s) to {}", len(pending), self.table_name)
+
+    def close(self) -> None:
+        """Stop the background writer and flush pending sessions."""
+        if not self._closed:
+            self._closed = True
+            self._wakeup.set()
+            self._flush_thread.join(timeout=5)
+        self.flush()
+
+    def upsert(self, session: Session, create_and_retry: bool = True) -> Session | None:
+        """Buffer a session for writing and return it."""
+        if not create_and_retry:
+            # SqliteStorage retries internally after creating the table; write through
+            return super().upsert(session, create_and_retry=False)
+        with self._pending_lock:
+            self._pending[session.session_id] = session
+        self._wakeup.set()
+        return session
+
+    def read(self, session_id: str, user_id: str | None = None) -> Session | None:
+        """Read a session, preferring a buffered copy that has not been written yet."""
+        with self._pending_lock:
+            pending = self._pending.get(session_id)
+        if pending is not None and (user_id is None or pending.user_id == user_id):
+            return pending
+        # Wait for an in-flight flush so the database copy is current
+        with self._flush_lock:
+            return super().read(session_id, user_id)
+
+    def get_all_session_ids(self, user_id: str | None = None, entity_id: str | None = None) -> list[str]:
+        """Flush buffered sessions, then list session ids."""
+        self.flush()
+        return super().get_all_session_ids(user_id, entity_id)
+
+    def get_all_sessions(self, user_id: str | None = None, entity_id: str | None = None) -> list[Session]:
+        """Flush buffered sessions, then list sessions."""
+        self.flush()
+        return super().get_all_sessions(user_id, entity_id)
+
+    def get_recent_sessions(self, *args, **kwargs) -> list[Session]:
+        """Flush buffered sessions, then list recent sessions."""
+        self.flush()
+        return super().get_recent_sessions(*args, **kwargs)
+
+    def delete_session(self, session_id: str | None = None):
+        """Drop any buffered copy and delete the session from the database."""
+        if session_id is not None:
+            with self._pending_lock:
+                self._pending.pop(session_id, None)
+        with self._flush_lock:
+            return super().delete_session(session_id)
+
+
+_STORAGE_CACHE: dict[tuple[Path, str], BatchingSqliteStorage] = {}
+_storage_cache_lock = threading.Lock()
+
+
+def get_shared_storage(db_path: Path, table_name: str) -> BatchingSqliteStorage:
+    """Return the process-wide storage for a table, creating it on first use."""
+    with _storage_cache_lock:
+        storage = _STORAGE_CACHE.get((db_path, table_name))
+        if storage is not None:
+            return storage
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not db_path.exists():
+            _init_sqlite_file(db_path)
+
+        storage = BatchingSqliteStorage(table_name=table_name, db_file=str(db_path))
+        # SqliteStorage replaces an injected db_engine with an in-memory one, so
+        # swap the shared, tuned engine in after construction instead
+        own_engine = storage.db_engine
+        storage.db_engine = _get_sqlite_engine(str(db_path))
+        storage.SqlSession = sessionmaker(bind=storage.db_engine)
+        storage.inspector = inspect(storage.db_engine)
+        own_engine.dispose()
+        _STORAGE_CACHE[(db_path, table_name)] = storage
+        logger.debug(f"Created agent storage at {db_path} with table {table_name}")
+        return storage
@@ -5,22 +5,56 @@ This module provides the abstract base class that all agent factories
 should implement to ensure consistency across different agent types.
 """
 
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from agno.agent import Agent
-from agno.memory.v2.memory import Memory
 from loguru import logger
 
-from ..prompts import BasePromptTemplate, get_prompt_registry
-from ..prompts.loaders import load_prompt_template
+# Agno and the prompt template system (LangChain) are imported where they are
+# used, so importing an agent factory module stays cheap
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.memory.v2.memory import Memory
+
+    from ..prompts import BasePromptTemplate
+
+# Process-wide cache of templates loaded from files, keyed by path and mtime so
+# that edits to a template file are picked up automatically.
+_YAML_CACHE: dict[tuple[Path, int], "BasePromptTemplate"] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _load_cached_prompt_template(template_path: Path) -> "BasePromptTemplate":
+    """Load a prompt template file, reusing a previously parsed copy if unchanged."""
+    from ..prompts.loaders import load_prompt_template
+
+    key = (template_path, template_path.stat().st_mtime_ns)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is None:
+            cached = load_prompt_template(template_path)
+            # Drop entries for older versions of the same file
+            for stale in [k for k in _YAML_CACHE if k[0] == template_path]:
+                del _YAML_CACHE[stale]
+            _YAML_CACHE[key] = cached
+    return cached
+
+
+@lru_cache(maxsize=32)
+def _render_instructions(template: "BasePromptTemplate", variables: tuple[tuple[str, Any], ...]) -> tuple[str, ...]:
+    """Render a template into instructions, memoized per template and variables."""
+    return tuple(template.get_instructions_list(**dict(variables)))
 
 
 class BaseAgentFactory(ABC):
     """Abstract base factory for creating Agno agents with consistent interfaces."""
 
-    def __init__(self, storage_path: Path | None = None, memory: Memory | None = None, **kwargs):
+    def __init__(self, storage_path: Path | None = None, memory: "Memory | None" = None, **kwargs):
         """
         Initialize the agent factory.
 
@@ -35,7 +69,7 @@ class BaseAgentFactory(ABC):
         self._prompt_template: BasePromptTemplate | None = None
 
     @abstractmethod
-    def create_agent(self, *args, **kwargs) -> Agent:
+    def create_agent(self, *args, **kwargs) -> "Agent":
         """
         Create and return a configured Agno Agent.
 
@@ -120,7 +154,7 @@ class BaseAgentFactory(ABC):
         # Default implementation - can be overridden
         return []
 
-    async def initialize_agent(self) -> Agent:
+    async def initialize_agent(self) -> "Agent":
         """
         Initialize and return the agent using the standard pattern.
 
@@ -158,6 +192,24 @@ class BaseAgentFactory(ABC):
             await self.cleanup_context(self._context)
             delattr(self, "_context")
 
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["Agent"]:
+        """
+        Run an agent session, guaranteeing cleanup of its context.
+
+        Usage:
+            async with factory.session() as agent:
+                await agent.arun(...)
+
+        Yields:
+            Initialized Agent instance
+        """
+        agent = await self.initialize_agent()
+        try:
+            yield agent
+        finally:
+            await self.cleanup()
+
     def get_prompt_template_name(self) -> str:
         """
         Get the name of the prompt template for this agent.
@@ -168,7 +220,7 @@ class BaseAgentFactory(ABC):
         # Default to agent display name with 'agents.' prefix
         return f"agents.{self.get_display_name()}"
 
-    def load_prompt_template(self, template_name: str | None = None) -> BasePromptTemplate:
+    def load_prompt_template(self, template_name: str | None = None) -> "BasePromptTemplate":
         """
         Load the prompt template for this agent.
 
@@ -179,25 +231,25 @@ class BaseAgentFactory(ABC):
             BasePromptTemplate instance
         """
         if self._prompt_template is None:
+            from ..prompts import BasePromptTemplate, PromptConfig, get_prompt_registry
+
             name = template_name or self.get_prompt_template_name()
-            try:
-                # Try to get from registry first
-                registry = get_prompt_registry()
+            # Try to get from registry first
+            registry = get_prompt_registry()
+            if name in registry:
                 self._prompt_template = registry.get(name)
                 logger.debug(f"Loaded prompt template '{name}' from registry")
-            except KeyError:
+            else:
                 # Fall back to loading from file
                 template_path = (
                     Path(__file__).parent.parent / "prompts" / "templates" / f"{name.replace('.', '/')}.yaml"
                 )
                 if template_path.exists():
-                    self._prompt_template = load_prompt_template(template_path)
+                    self._prompt_template = _load_cached_prompt_template(template_path)
                     logger.debug(f"Loaded prompt template from file: {template_path}")
                 else:
                     logger.warning(f"No prompt template found for '{name}', using legacy instructions")
                     # Create a template from legacy instructions
-                    from ..prompts import PromptConfig
-
                     instructions = self.get_agent_instructions()
                     self._prompt_template = BasePromptTemplate(
                         config=PromptConfig(
@@ -218,4 +270,6 @@ class BaseAgentFactory(ABC):
             List of instruction strings
         """
         template = self.load_prompt_template()
-        return template.get_instructions_list(**kwargs)
+        # Rendering depends only on the template and its variables, so repeated
+        # session setups reuse the result. Callers may extend the returned list.
+        return list(_render_instructions(template, tuple(sorted(kwargs.items()))))
@@ -0,0 +1,51 @@
+"""
+Environment configuration shared by the agent factories.
+
+Agent setup reads the same handful of credentials several times per session;
+they are read from the environment once and reused.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from os import getenv
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class AgentEnv:
+    """Credentials and endpoints used by the agent factories."""
+
+    github_token: str | None
+    github_tokens: tuple[str, ...]
+    jira_url: str | None
+    jira_token: str | None
+
+
+@lru_cache(maxsize=1)
+def get_agent_env() -> AgentEnv:
+    """Read the agent environment variables once per process.
+
+    Call ``get_agent_env.cache_clear()`` after changing the environment.
+
+    Returns:
+        AgentEnv populated from the environment
+    """
+    github_token = getenv("GITHUB_ACCESS_TOKEN")
+    raw_tokens = getenv("GITHUB_ACCESS_TOKENS") or github_token or ""
+    return AgentEnv(
+        github_token=github_token,
+        github_tokens=tuple(token.strip() for token in raw_tokens.split(",") if token.strip()),
+        jira_url=getenv("JIRA_URL"),
+        jira_token=getenv("JIRA_PERSONAL_TOKEN"),
+    )
+
+
+@lru_cache(maxsize=1)
+def log_agent_env_status() -> None:
+    """Log which agent credentials are set, once per process."""
+    env = get_agent_env()
+    logger.info(
+        "Agent environment: JIRA_URL={} JIRA_PERSONAL_TOKEN={} GITHUB_ACCESS_TOKEN={}",
+        *("set" if value else "NOT SET" for value in (env.jira_url, env.jira_token, env.github_tokens)),
+    )
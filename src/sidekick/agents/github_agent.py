@@ -6,20 +6,114 @@ with GitHub repositories in a conversational manner. Uses agno.tools.github
 for GitHub API access with interactive question loops.
 """
 
-from os import getenv
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from agno.agent import Agent
-from agno.memory.v2.memory import Memory
-from agno.models.google import Gemini
-from agno.storage.sqlite import SqliteStorage
-from agno.tools.file import FileTools
-from agno.tools.github import GithubTools
 from loguru import logger
 
+from ..utils.github_cache import install_github_etag_cache
+from ._shared import get_file_tools, with_session_summaries
 from .base import BaseAgentFactory
+from .env import get_agent_env, log_agent_env_status
 from .mixins.storage_mixin import StorageMixin
 
+# Agno models and tools pull in the Google, MCP and PyGithub SDKs, so they are
+# imported where they are used rather than at module load
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.memory.v2.memory import Memory
+    from agno.storage.sqlite import SqliteStorage
+    from agno.tools.github import GithubTools
+
+
+@lru_cache(maxsize=8)
+def _build_github_tools(access_token: str) -> "GithubTools":
+    """Build GithubTools for a token, reused across sessions in this process.
+
+    The granular pull request tools are disabled in favour of
+    get_pull_request_with_details and the GraphQL tools, which fetch the same
+    data in fewer requests.
+
+    Args:
+        access_token: GitHub access token
+
+    Returns:
+        GithubTools instance with all capabilities enabled
+    """
+    from agno.tools.github import GithubTools
+
+    return GithubTools(
+        access_token=access_token,
+        search_repositories=True,
+        list_repositories=True,
+        get_repository=True,
+        get_pull_request=False,
+        get_pull_request_changes=False,
+        get_pull_request_comments=False,
+        list_branches=True,
+        get_pull_request_count=True,
+        get_pull_requests=False,
+        get_pull_request_with_details=True,
+        get_repository_with_stats=True,
+        list_issues=True,
+        get_issue=True,
+        get_file_content=True,
+        get_directory_content=True,
+        get_branch_content=True,
+        search_code=True,
+        search_issues_and_prs=True,
+    )
+
+
+# Hourly request budget of an authenticated GitHub token; assumed for tokens
+# that have not made a request yet
+GITHUB_RATE_LIMIT = 5000
+
+
+def _remaining_rate_limit(token: str) -> int:
+    """Requests left for a token as of its last response (-1 if unknown)."""
+    return int(_build_github_tools(token).g.requester.rate_limiting[0])
+
+
+class TokenRotator:
+    """Hands out GitHub tokens round-robin, preferring the most remaining rate limit."""
+
+    def __init__(self, tokens: list[str], remaining: Callable[[str], int] = _remaining_rate_limit):
+        """Initialize the rotator.
+
+        Args:
+            tokens: GitHub access tokens to rotate between
+            remaining: Returns the remaining rate limit for a token (-1 if unknown)
+        """
+        self._tokens = tokens
+        self._start = 0
+        self._remaining = remaining
+
+    def _budget(self, token: str) -> int:
+        """Remaining requests of a token, counting an unused token as a full budget."""
+        remaining = self._remaining(token)
+        return GITHUB_RATE_LIMIT if remaining < 0 else remaining
+
+    def next_token(self) -> str:
+        """Return the token with the most remaining requests.
+
+        Ties, including tokens that have not been used yet, are broken in
+        round-robin order: each call starts ranking one token further along.
+        """
+        start = self._start
+        count = len(self._tokens)
+        self._start = (start + 1) % count
+        best = max(range(count), key=lambda i: (self._budget(self._tokens[(start + i) % count]), -i))
+        return self._tokens[(start + best) % count]
+
+
+@lru_cache(maxsize=8)
+def _get_token_rotator(tokens: tuple[str, ...]) -> TokenRotator:
+    """Return the process-wide rotator for a set of tokens."""
+    return TokenRotator(list(tokens))
+
 
 class GitHubAgent(StorageMixin, BaseAgentFactory):
     """Factory class for creating GitHub-enabled Agno agents."""
@@ -29,7 +123,7 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         storage_path: Path | None = None,
         repository: str | None = None,
         workspace_dir: Path | None = None,
-        memory: Memory | None = None,
+        memory: "Memory | None" = None,
     ):
         """
         Initialize the GitHub agent factory.
@@ -49,12 +143,16 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
 
         super().__init__(storage_path=storage_path, memory=memory, repository=repository)
 
+        # The repository is fixed for the lifetime of the factory, so the
+        # instructions only need to be assembled once
+        self._cached_instructions = tuple(self._build_instructions())
+
         logger.debug(
             f"GitHubAgent factory initialized: storage_path={storage_path}, "
             f"repository={repository}, workspace_dir={self.workspace_dir}"
         )
 
-    def create_github_tools(self) -> GithubTools:
+    def create_github_tools(self) -> "GithubTools":
         """Create and return configured GitHub tools.
 
         Returns:
@@ -63,34 +161,21 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         Raises:
             ValueError: If required environment variables are missing
         """
-        # Get environment variables
-        github_token = getenv("GITHUB_ACCESS_TOKEN")
+        # Tokens come from GITHUB_ACCESS_TOKENS (comma-separated) or GITHUB_ACCESS_TOKEN
+        github_tokens = get_agent_env().github_tokens
 
-        if not github_token:
+        if not github_tokens:
             raise ValueError("GITHUB_ACCESS_TOKEN environment variable is required for GitHub integration")
 
-        # Create GitHub tools with all capabilities enabled
-        github_tools = GithubTools(
-            access_token=github_token,
-            search_repositories=True,
-            list_repositories=True,
-            get_repository=True,
-            get_pull_request=True,
-            get_pull_request_changes=True,
-            get_pull_request_comments=True,
-            list_branches=True,
-            get_pull_request_count=True,
-            get_pull_requests=True,
-            get_pull_request_with_details=True,
-            get_repository_with_stats=True,
-            list_issues=True,
-            get_issue=True,
-            get_file_content=True,
-            get_directory_content=True,
-            get_branch_content=True,
-            search_code=True,
-            search_issues_and_prs=True,
-        )
+        # Spread sessions over all configured tokens to multiply the rate limit
+        github_token = _get_token_rotator(github_tokens).next_token()
+
+        # Make repeated GETs conditional so unchanged resources do not use rate limit
+        if self.storage_path:
+            install_github_etag_cache(self.storage_path.parent / "gh_cache.db")
+
+        # Tools are cached per token, so repeated sessions reuse the same instance
+        github_tools = _build_github_tools(github_token)
 
         logger.debug("GitHub tools created successfully")
         return github_tools
@@ -98,6 +183,14 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
     def get_agent_instructions(self) -> list[str]:
         """Get the instructions for the GitHub agent.
 
+        Returns:
+            List of instruction strings for the agent
+        """
+        return list(self._cached_instructions)
+
+    def _build_instructions(self) -> list[str]:
+        """Assemble the instructions from the prompt template and repository.
+
         Returns:
             List of instruction strings for the agent
         """
@@ -113,7 +206,7 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
 
         return instructions
 
-    def create_storage(self, table_name: str = "github_agent_sessions") -> SqliteStorage:
+    def create_storage(self, table_name: str = "github_agent_sessions") -> "SqliteStorage":
         """Create and return configured storage for the agent.
 
         Args:
@@ -124,7 +217,7 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         """
         return super().create_storage(table_name=table_name)
 
-    def create_agent(self, github_tools: GithubTools) -> Agent:
+    def create_agent(self, github_tools: "GithubTools") -> "Agent":
         """Create and return a configured Agno Agent with GitHub capabilities.
 
         Args:
@@ -133,10 +226,14 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         Returns:
             Configured Agno Agent instance
         """
-        # Log required environment variables
-        github_token = getenv("GITHUB_ACCESS_TOKEN")
+        from agno.agent import Agent
+        from agno.models.google import Gemini
 
-        logger.info(f"GITHUB_ACCESS_TOKEN: {'set' if github_token else 'NOT SET'}")
+        from ..tools.github_graphql import GitHubGraphQLTools
+
+        # Log required environment variables
+        log_agent_env_status()
+        github_token = github_tools.access_token
 
         # Create storage
         storage = self.create_storage()
@@ -144,21 +241,25 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         # Get instructions
         instructions = self.get_agent_instructions()
 
+        # GraphQL tools fetch nested PR and issue data in a single request
+        graphql_tools = GitHubGraphQLTools(access_token=github_token) if github_token else None
+
         # Create file tools for workspace operations
-        file_tools = FileTools(base_dir=self.workspace_dir)
+        file_tools = get_file_tools(str(self.workspace_dir))
 
         # Create the agent
         agent = Agent(
             name="GitHub Assistant",
             model=Gemini(id="gemini-2.5-flash"),
             instructions=instructions,
-            tools=[github_tools, file_tools],
+            tools=[tool for tool in (github_tools, graphql_tools, file_tools) if tool is not None],
             storage=storage,
-            memory=self.memory,
+            memory=with_session_summaries(self.memory),
             enable_agentic_memory=bool(self.memory),
             add_datetime_to_instructions=True,
-            add_history_to_messages=True,
-            num_history_runs=3,
+            # A rolling session summary replaces re-sending full prior runs
+            enable_session_summaries=True,
+            add_history_to_messages=False,
             markdown=True,
         )
 
@@ -169,13 +270,13 @@ class GitHubAgent(StorageMixin, BaseAgentFactory):
         """Return list of required environment variables."""
         return ["GITHUB_ACCESS_TOKEN"]
 
-    async def setup_context(self) -> GithubTools:
+    async def setup_context(self) -> "GithubTools":
         """Setup async context - create GitHub tools."""
         return self.create_github_tools()
 
-    async def cleanup_context(self, context: GithubTools) -> None:
-        """Cleanup async context - nothing to cleanup for GitHub tools."""
-        pass
+    async def cleanup_context(self, context: "GithubTools") -> None:
+        """Cleanup async context - flush buffered session writes."""
+        self.flush_storage()
 
     def get_extra_info(self) -> list[str]:
         """Get extra information to display when starting the agent."""
@@ -6,18 +6,30 @@ with Jira in a conversational manner. Supports both JiraTools and MCP Atlassian
 server integration with interactive question loops.
 """
 
-from os import getenv
+import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from agno.agent import Agent
-from agno.memory.v2.memory import Memory
-from agno.models.google import Gemini
-from agno.tools.mcp import MCPTools
 from loguru import logger
 
+from ._shared import new_session_id, with_session_summaries
 from .base import BaseAgentFactory
+from .env import get_agent_env
 from .mixins import JiraMixin, StorageMixin, WorkspaceMixin
 
+# Agno models and tools pull in the Google and MCP SDKs, so they are imported
+# where they are used rather than at module load
+if TYPE_CHECKING:
+    from agno.agent import Agent, RunResponse
+    from agno.memory.v2.memory import Memory
+    from agno.tools.mcp import MCPTools
+
+# Storage table of the Jira agent's sessions
+_SESSIONS_TABLE = "jira_agent_sessions"
+
+# Question asking the agent for the details of a ticket
+TICKET_PROMPT = "Get detailed information for Jira ticket {ticket_id}"
+
 
 class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
     """Factory class for creating Jira-enabled Agno agents with MCP integration."""
@@ -26,7 +38,7 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
         self,
         storage_path: Path | None = None,
         workspace_dir: Path | None = None,
-        memory: Memory | None = None,
+        memory: "Memory | None" = None,
     ):
         """
         Initialize the Jira agent factory.
@@ -46,8 +58,12 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
             memory=memory,
             read_only_mode=True,  # JiraAgent uses read-only mode
         )
+        # MCP server kept started across ask() calls until aclose()
+        self._mcp_tools: MCPTools | None = None
+        # Makes concurrent first questions wait for one server start
+        self._mcp_lock = asyncio.Lock()
 
-        logger.debug(f"JiraAgent factory initialized: storage_path={storage_path}, workspace_dir={workspace_dir}")
+        logger.debug("JiraAgent factory initialized: storage_path={}, workspace_dir={}", storage_path, workspace_dir)
 
     def get_agent_instructions(self) -> list[str]:
         """Get the instructions for the Jira agent.
@@ -56,10 +72,10 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
             List of instruction strings for the agent
         """
         # Use the new prompt template system
-        jira_url = getenv("JIRA_URL", "your JIRA instance")
+        jira_url = get_agent_env().jira_url or "your JIRA instance"
         return self.get_agent_instructions_from_template(jira_instance=jira_url)
 
-    def create_agent(self, mcp_tools: MCPTools) -> Agent:
+    def create_agent(self, mcp_tools: "MCPTools") -> "Agent":
         """Create and return a configured Agno Agent with Jira capabilities.
 
         Args:
@@ -68,11 +84,14 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
         Returns:
             Configured Agno Agent instance
         """
+        from agno.agent import Agent
+        from agno.models.google import Gemini
+
         # Log required environment variables
         self.log_jira_env_status()
 
         # Create storage
-        storage = self.create_storage("jira_agent_sessions")
+        storage = self.create_storage(_SESSIONS_TABLE)
 
         # Get instructions
         instructions = self.get_agent_instructions()
@@ -87,11 +106,12 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
             instructions=instructions,
             tools=[mcp_tools, file_tools],
             storage=storage,
-            memory=self.memory,
+            memory=with_session_summaries(self.memory),
             enable_agentic_memory=bool(self.memory),
             add_datetime_to_instructions=True,
-            add_history_to_messages=True,
-            num_history_runs=3,
+            # A rolling session summary replaces re-sending full prior runs
+            enable_session_summaries=True,
+            add_history_to_messages=False,
             markdown=True,
         )
 
@@ -102,10 +122,109 @@ class JiraAgent(JiraMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory):
         """Return list of required environment variables."""
         return super().get_required_env_vars()  # From JiraMixin
 
-    async def setup_context(self) -> MCPTools:
+    async def setup_context(self) -> "MCPTools":
         """Setup async context - create and start MCP tools."""
         return await self.setup_mcp_context()
 
-    async def cleanup_context(self, context: MCPTools) -> None:
-        """Cleanup async context - stop MCP tools."""
+    async def cleanup_context(self, context: "MCPTools") -> None:
+        """Cleanup async context - flush buffered session writes and stop MCP tools."""
+        self.flush_storage()
         await self.cleanup_mcp_context(context)
+
+    async def _get_mcp_tools(self) -> "MCPTools":
+        """Return the started MCP tools, starting the server on first use.
+
+        The session storage is opened in a worker thread while the server
+        starts, so the first question waits for the slower of the two only.
+        """
+        if self._mcp_tools is not None:
+            return self._mcp_tools
+        async with self._mcp_lock:
+            if self._mcp_tools is None:
+                mcp_tools, storage = await asyncio.gather(
+                    self.setup_context(),
+                    asyncio.to_thread(self.create_storage, _SESSIONS_TABLE),
+                    return_exceptions=True,
+                )
+                if isinstance(mcp_tools, BaseException):
+                    raise mcp_tools
+                if isinstance(storage, BaseException):
+                    await self.cleanup_context(mcp_tools)
+                    raise storage
+                self._mcp_tools = mcp_tools
+            return self._mcp_tools
+
+    async def aclose(self) -> None:
+        """Flush buffered session writes and release the MCP server kept by ask()."""
+        async with self._mcp_lock:
+            if self._mcp_tools is not None:
+                mcp_tools, self._mcp_tools = self._mcp_tools, None
+                await self.cleanup_context(mcp_tools)
+
+    async def __aenter__(self) -> "JiraAgent":
+        """Async context manager entry - the MCP server is started by the first question."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - releases the MCP server."""
+        _ = exc_type, exc_val, exc_tb  # Unused parameters
+        await self.aclose()
+
+    async def ask(self, question: str, session_id: str | None = None, user_id: str | None = None) -> "RunResponse":
+        """Answer a single question in its own agent session.
+
+        The MCP server is started on the first question and kept for later
+        ones; use the factory as an async context manager, or call aclose(),
+        to release it.
+
+        Args:
+            question: Question to ask the agent
+            session_id: Session to continue (default: a new session)
+            user_id: Optional user ID for memory
+
+        Returns:
+            The agent's run response
+        """
+        agent = self.create_agent(await self._get_mcp_tools())
+        return await agent.arun(question, stream=False, session_id=session_id or new_session_id(), user_id=user_id)
+
+    async def ask_many(self, questions: list[str], user_id: str | None = None) -> list["RunResponse"]:
+        """Answer several questions concurrently.
+
+        Agents keep per-run state, so each question gets its own Agent and
+        session. They share the MCP server kept by the factory (see ask()).
+
+        Args:
+            questions: Questions to ask
+            user_id: Optional user ID for memory
+
+        Returns:
+            Run responses in the order of the questions
+        """
+        mcp_tools = await self._get_mcp_tools()
+        agents = [self.create_agent(mcp_tools) for _ in questions]
+        return await asyncio.gather(
+            *(
+                agent.arun(question, stream=False, session_id=new_session_id(), user_id=user_id)
+                for agent, question in zip(agents, questions, strict=True)
+            )
+        )
+
+    def _ticket_prompt(self, ticket_id: str) -> str:
+        """Return the question asking the agent for the details of a ticket."""
+        return TICKET_PROMPT.format(ticket_id=ticket_id)
+
+    async def fetch_tickets(self, ticket_ids: list[str], user_id: str | None = None) -> list["RunResponse"]:
+        """Fetch several tickets concurrently.
+
+        The MCP tool calls of all tickets overlap, so fetching N tickets takes
+        about as long as the slowest one rather than N round trips to Jira.
+
+        Args:
+            ticket_ids: Jira ticket IDs (e.g. PROJ-123)
+            user_id: Optional user ID for memory
+
+        Returns:
+            Run responses in the order of the ticket IDs
+        """
+        return await self.ask_many([self._ticket_prompt(ticket_id) for ticket_id in ticket_ids], user_id=user_id)
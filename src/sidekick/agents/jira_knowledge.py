@@ -5,15 +5,19 @@ This module provides a JiraKnowledgeManager class that loads, indexes, and retri
 for use in retrieval-augmented generation (RAG) workflows, such as with JiraTriagerAgent.
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from agno.embedder.google import GeminiEmbedder
-from agno.knowledge.json import JSONKnowledgeBase
-from agno.vectordb.lancedb import LanceDb, SearchType
 from loguru import logger
 
+# LanceDB and the Google SDK are only needed once issues are indexed or searched
+if TYPE_CHECKING:
+    from agno.knowledge.json import JSONKnowledgeBase
+    from agno.vectordb.lancedb import LanceDb
+
 
 class JiraKnowledgeManager:
     """Manages Jira issues for RAG-based triage and retrieval."""
@@ -40,7 +44,6 @@ class JiraKnowledgeManager:
         self.data_path = data_path
         self.vector_db_path = vector_db_path
         self.table_name = table_name
-        self._issues: list[dict[str, Any]] = []
         self._vector_db: LanceDb | None = None
         self._knowledge: JSONKnowledgeBase | None = None
         self._loaded = False
@@ -59,30 +62,121 @@ class JiraKnowledgeManager:
         if self._loaded and not recreate:
             logger.debug("Jira issues already loaded and indexed.")
             return
+        # The knowledge base reads and parses the file itself when indexing
         logger.info(f"Loading Jira issues from {self.data_path}")
-        with open(self.data_path) as f:
-            self._issues = json.load(f)
-        logger.info(f"Loaded {len(self._issues)} Jira issues.")
-        # Index issues for semantic search
-        self._vector_db = LanceDb(
-            uri=str(self.vector_db_path),
-            table_name=self.table_name,
-            search_type=SearchType.hybrid,
-            embedder=GeminiEmbedder(),
-        )
+        from agno.knowledge.json import JSONKnowledgeBase
+
         self._knowledge = JSONKnowledgeBase(
             path=self.data_path,
             vector_db=self.get_vector_db(),
             num_documents=10,
         )
-        if self._knowledge is not None:
-            self._knowledge.load_document(path=self.data_path, recreate=recreate)
+        fingerprint = self._data_fingerprint()
+        indexed = self._read_index_fingerprint()
+        if not recreate and indexed and indexed.get("sha1") == fingerprint["sha1"] and self.get_vector_db().exists():
+            # The index was built from this exact file; skip re-reading and embedding it
+            logger.debug("Jira knowledge base unchanged since last index, skipping re-indexing.")
+        elif self._knowledge is not None:
+            if not recreate and self.get_vector_db().exists():
+                self._update_index()
+            else:
+                self._knowledge.load_document(path=self.data_path, recreate=recreate)
+            self._write_index_fingerprint(fingerprint)
         self._loaded = True
         logger.debug("Jira issues indexed for semantic search.")
 
-    def get_vector_db(self) -> LanceDb:
+    def _update_index(self) -> None:
+        """Bring an existing index in line with the data file, embedding only new or changed issues.
+
+        LanceDB rows are keyed by the MD5 of the document content, so an edited
+        issue shows up as one new document and one stale row.
+        """
+        if self._knowledge is None or self._knowledge.reader is None:
+            return
+        vector_db = self.get_vector_db()
+        table = vector_db.table
+        documents = {
+            hashlib.md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest(): document
+            for document in self._knowledge.reader.read(self.data_path)
+        }
+        indexed = {row["id"] for row in table.search().select(["id"]).limit(table.count_rows()).to_list()}
+
+        stale = indexed - documents.keys()
+        if stale:
+            table.delete("id IN ({})".format(", ".join(f"'{doc_id}'" for doc_id in stale)))
+        added = [document for doc_id, document in documents.items() if doc_id not in indexed]
+        if added:
+            vector_db.insert(documents=added)
+        logger.info(f"Updated Jira knowledge index: {len(added)} issues embedded, {len(stale)} removed.")
+
+    def search_issues(self, query: str, num_documents: int | None = None, component: str | None = None) -> list[str]:
+        """
+        Return the historical issues most similar to a query.
+
+        With a component, a full page of candidates is retrieved and narrowed to
+        issues of that component; if none of them match, the closest issues of
+        any component are returned instead.
+
+        Args:
+            query: Text to search for, e.g. a ticket's title and description
+            num_documents: Number of issues to return (default: the knowledge base's num_documents)
+            component: Prefer issues filed against this component
+
+        Returns:
+            JSON documents of the matching issues, most similar first
+        """
+        self.load_issues()
+        if self._knowledge is None:
+            return []
+        if not component:
+            return [document.content for document in self._knowledge.search(query=query, num_documents=num_documents)]
+        limit = num_documents or self._knowledge.num_documents
+        candidates = [
+            document.content
+            for document in self._knowledge.search(query=query, num_documents=max(limit, self._knowledge.num_documents))
+        ]
+        matching = [content for content in candidates if json.loads(content).get("component") == component]
+        return (matching or candidates)[:limit]
+
+    @property
+    def _fingerprint_path(self) -> Path:
+        """File recording which version of the data file the index was built from."""
+        return self.vector_db_path / f".{self.table_name}.fingerprint"
+
+    def _data_fingerprint(self) -> dict[str, Any]:
+        """Fingerprint the data file by size, mtime and content hash.
+
+        The content hash is reused from the stored fingerprint while size and
+        mtime are unchanged, so an untouched file is not hashed again.
+        """
+        stat = self.data_path.stat()
+        stored = self._read_index_fingerprint()
+        if stored and stored.get("size") == stat.st_size and stored.get("mtime_ns") == stat.st_mtime_ns:
+            sha1 = stored.get("sha1")
+        else:
+            sha1 = hashlib.sha1(self.data_path.read_bytes()).hexdigest()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": sha1}
+
+    def _read_index_fingerprint(self) -> dict[str, Any] | None:
+        """Return the fingerprint stored with the index, if any."""
+        try:
+            return json.loads(self._fingerprint_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_index_fingerprint(self, fingerprint: dict[str, Any]) -> None:
+        """Atomically store the fingerprint of the data file the index was built from."""
+        self._fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._fingerprint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(fingerprint))
+        os.replace(tmp_path, self._fingerprint_path)
+
+    def get_vector_db(self) -> "LanceDb":
         """Get or create the LanceDB vector database instance."""
         if self._vector_db is None:
+            from agno.embedder.google import GeminiEmbedder
+            from agno.vectordb.lancedb import LanceDb, SearchType
+
             logger.debug("Creating LanceDB vector database")
             self._vector_db = LanceDb(
                 uri=str(self.vector_db_path),
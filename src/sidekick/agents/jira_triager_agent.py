@@ -5,21 +5,257 @@ This module implements an AI agent that analyzes previous support tickets and a
 and recommends the best-matching team and component for assignment.
 """
 
+import asyncio
+import hashlib
 import json
 import os
-import re
-import uuid
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from agno.agent import Agent
-from agno.models.google import Gemini
-from agno.storage.sqlite import SqliteStorage
 from loguru import logger
+from pydantic import BaseModel, Field
 
-from sidekick.utils.jira_client_utils import clean_jira_description, get_project_component_names
+from sidekick.utils.semantic_cache import SemanticCache
 
-from .jira_knowledge import JiraKnowledgeManager
+from ._shared import new_session_id
+
+# Agno, the Google SDK, LanceDB and the Jira client are imported where they are
+# used, so importing this module (e.g. by the CLI) stays cheap
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.storage.sqlite import SqliteStorage
+
+    from .jira_knowledge import JiraKnowledgeManager
+
+DEFAULT_SEMANTIC_CACHE_PATH = Path("tmp/jira_triager_cache.sqlite")
+
+TRIAGE_MODEL_ID = "gemini-2.0-flash"
+
+# Descriptions are cut to this many characters in prompts and cache lookups;
+# the opening paragraphs carry nearly all of the signal for triage
+DEFAULT_MAX_DESCRIPTION_CHARS = 4000
+
+# Number of exact-match triage results kept in memory per triager
+RESULT_CACHE_SIZE = 1024
+
+# Confidence of a team or component derived from the team-to-components map
+# without asking the model; the map is a reference, not an absolute rule
+COMPONENT_MAP_CONFIDENCE = 0.8
+
+# Number of similar historical tickets quoted in each prompt
+SIMILAR_TICKETS_LIMIT = 5
+
+# Fields of a historical ticket quoted in prompts; its key and anything else are left out
+_REFERENCE_FIELDS = ("title", "description", "component", "team")
+
+# Terminal states of a Gemini batch job other than success
+_FAILED_BATCH_STATES = frozenset(("JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"))
+
+
+class TriageRecommendation(BaseModel):
+    """Structured reply of the triager; Gemini is constrained to this schema."""
+
+    team: str | None = Field(None, description="Recommended team, if the team is missing")
+    component: str | None = Field(None, description="Recommended component, if the component is missing")
+    confidence: float = Field(..., description="Confidence in the recommendation, between 0.0 and 1.0")
+
+
+class TicketTriageRecommendation(TriageRecommendation):
+    """Recommendation for one ticket of a grouped triage."""
+
+    id: int = Field(..., description="Id of the ticket in the prompt")
+
+
+class GroupTriageRecommendation(BaseModel):
+    """Structured reply to a prompt triaging several tickets at once."""
+
+    recommendations: list[TicketTriageRecommendation] = Field(..., description="One recommendation per ticket")
+
+
+# Instructions around the configured teams and team-to-components summary.
+# They are identical for every ticket, so each request starts with the same
+# prefix that Gemini can serve from its context cache; keep them terse, they
+# are sent with every triage.
+_INSTRUCTIONS_PREFIX = (
+    "You are an expert Jira ticket triager.",
+    "Recommend the best team and component for a new Jira issue, based on previous support tickets.",
+    "Be CONSISTENT: identical tickets must get identical assignments.",
+    "",
+)
+_INSTRUCTIONS_SUFFIX = (
+    "",
+    "ANALYSIS:",
+    "- Compare the ticket with the similar historical tickets from the prompt; weight their assignments by similarity.",
+    "- Look for exact technical keywords: feature/plugin names, error messages, stack traces, technologies "
+    "(e.g., 'RBAC' → 'RBAC Plugin', React/Frontend → Frontend team, Docker/Helm → Install team).",
+    "- Component priority: exact feature/plugin name (RBAC Plugin, TechDocs, Quay Plugin), then "
+    "technology-specific (Authentication, Installation & Run, Dynamic plugins), and only as a last resort "
+    "general categories (Plugins, UI, Core platform).",
+    "- Use any assigned component, team or assignee as context for the missing field(s).",
+    "",
+    "CONFIDENCE: 0.9-1.0 very similar tickets with exact keyword matches; 0.7-0.8 good keyword overlap and "
+    "consistent assignments; 0.5-0.6 mixed patterns or little data; 0.3-0.4 weak similarity; "
+    "0.1-0.2 no clear similar tickets.",
+    "",
+    "OUTPUT: ONLY a JSON object, without explanation or markdown, holding just the missing field(s) and a "
+    'mandatory float confidence between 0.0 and 1.0, e.g. {"team": "Team Name", "component": "Component Name", '
+    '"confidence": 0.85}.',
+)
+
+
+def _load_json_env(name: str) -> Any:
+    """Parse a required single-line JSON environment variable.
+
+    Raises:
+        ValueError: If the variable is not set
+    """
+    raw_value = os.getenv(name)
+    if not raw_value:
+        raise ValueError(f"{name} environment variable is required")
+    return json.loads(raw_value)
+
+
+# Team configuration is read from the environment and parsed at most once per
+# process; call clear_config_cache() after changing the environment.
+
+
+@cache
+def _allowed_teams() -> tuple[str, ...]:
+    """Teams the triager may assign, from ALLOWED_TEAMS."""
+    return tuple(_load_json_env("ALLOWED_TEAMS"))
+
+
+@cache
+def _allowed_team_set() -> frozenset[str]:
+    """ALLOWED_TEAMS as a set, for validating recommendations."""
+    return frozenset(_allowed_teams())
+
+
+@cache
+def _component_team_map() -> MappingProxyType[str, list[str]]:
+    """Components associated with each team, from COMPONENT_TEAM_MAP."""
+    return MappingProxyType(_load_json_env("COMPONENT_TEAM_MAP"))
+
+
+@cache
+def _team_assignee_map() -> MappingProxyType[str, list[str]]:
+    """Members of each team, from TEAM_ASSIGNEE_MAP."""
+    return MappingProxyType(_load_json_env("TEAM_ASSIGNEE_MAP"))
+
+
+@cache
+def _build_instructions() -> str:
+    """Build the triager instructions for the configured teams.
+
+    The instructions are a single string: Agno renders each item of a list as
+    a separate bullet, which would bullet every line and blank separator.
+
+    Returns:
+        Instructions for the agent
+    """
+    return "\n".join(
+        (
+            *_INSTRUCTIONS_PREFIX,
+            f"Only choose from these teams: {', '.join(_allowed_teams())}.",
+            "The prompt gives the current ticket (title, description, component, team, assignee), "
+            "the components allowed for it and similar historical tickets with their team and component.",
+            "Team-to-components associations (reference, not absolute):",
+            *(f"{team}: {', '.join(sorted(components))}" for team, components in _component_team_map().items()),
+            *_INSTRUCTIONS_SUFFIX,
+        )
+    )
+
+
+@cache
+def _assignee_to_team() -> dict[str, str]:
+    """Invert TEAM_ASSIGNEE_MAP into a member-to-team lookup.
+
+    Returns:
+        Mapping of stripped member name to the first team listing them
+    """
+    assignee_to_team: dict[str, str] = {}
+    for team, members in _team_assignee_map().items():
+        for member in members:
+            assignee_to_team.setdefault(member.strip(), team)
+    return assignee_to_team
+
+
+@cache
+def _component_to_teams() -> dict[str, tuple[str, ...]]:
+    """Invert COMPONENT_TEAM_MAP into a component-to-teams lookup.
+
+    Returns:
+        Mapping of component name to the teams associated with it
+    """
+    component_to_teams: dict[str, list[str]] = {}
+    for team, components in _component_team_map().items():
+        for component in components:
+            component_to_teams.setdefault(component, []).append(team)
+    return {component: tuple(teams) for component, teams in component_to_teams.items()}
+
+
+@lru_cache(maxsize=512)
+def _assignee_team_info(assignee: str) -> str:
+    """Return the prompt line naming the team of an assignee, or "" if they are in none.
+
+    Args:
+        assignee: Assignee of the current ticket
+    """
+    team = _assignee_to_team().get(assignee.strip())
+    if team:
+        return f"The current assignee ('{assignee}') is a member of the team '{team}'. Assign the ticket to this team."
+    return ""
+
+
+@lru_cache(maxsize=32)
+def _allowed_components_line(components: tuple[str, ...]) -> str:
+    """Return the prompt line listing the components a ticket may be assigned.
+
+    Args:
+        components: Allowed component names, as returned for the ticket's project
+    """
+    return f"Allowed components: {', '.join(components)}"
+
+
+def clear_config_cache() -> None:
+    """Forget the parsed team configuration so it is re-read from the environment."""
+    for cached in (
+        _allowed_teams,
+        _allowed_team_set,
+        _component_team_map,
+        _team_assignee_map,
+        _build_instructions,
+        _assignee_to_team,
+        _assignee_team_info,
+        _component_to_teams,
+    ):
+        cached.cache_clear()
+    with _agent_cache_lock:
+        _AGENT_CACHE.clear()
+
+
+# Agno agents are built once per session database and shared by all triagers
+# using it; sessions are kept apart by the session_id passed to each run.
+_AGENT_CACHE: dict[Path, "Agent"] = {}
+_agent_cache_lock = threading.Lock()
+
+
+def _project_key(ticket: dict[str, Any]) -> str:
+    """Project whose components a ticket may be assigned, defaulting to RHIDP."""
+    return ticket.get("project_key") or "RHIDP"
+
+
+def _ticket_component(ticket: dict[str, Any]) -> str:
+    """Component of a ticket as a string; a list of components is joined in sorted order."""
+    component = ticket.get("component") or ""
+    if isinstance(component, list | tuple):
+        return ", ".join(sorted(name for name in component if name))
+    return component
 
 
 class JiraTriagerAgent:
@@ -35,9 +271,13 @@ class JiraTriagerAgent:
 
     def __init__(
         self,
-        jira_knowledge_manager: JiraKnowledgeManager,
+        jira_knowledge_manager: "JiraKnowledgeManager",
         storage_path: Path | None = None,
         user_id: str | None = None,
+        semantic_cache_path: Path | None = DEFAULT_SEMANTIC_CACHE_PATH,
+        semantic_cache_threshold: float = 0.95,
+        strict_llm: bool = False,
+        max_description_chars: int = DEFAULT_MAX_DESCRIPTION_CHARS,
     ):
         """
         Initialize the Jira triager agent.
@@ -46,6 +286,10 @@ class JiraTriagerAgent:
             jira_knowledge_manager: JiraKnowledgeManager for RAG
             storage_path: Path for agent session storage
             user_id: Optional user ID for session management
+            semantic_cache_path: Database reusing triages of near-duplicate tickets (None disables it)
+            semantic_cache_threshold: Minimum similarity for a cached triage to be reused
+            strict_llm: Always ask the model, even when the configuration determines the answer
+            max_description_chars: Length beyond which ticket descriptions are truncated
         """
         if storage_path is None:
             storage_path = Path("tmp/jira_triager_agent.db")
@@ -53,15 +297,22 @@ class JiraTriagerAgent:
         self.storage_path = storage_path
         self.user_id = user_id
         self._agent: Agent | None = None
-        self._initialized = False
+        self._storage: SqliteStorage | None = None
         self._session_id: str | None = None
+        self.semantic_cache_path = semantic_cache_path
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self._semantic_cache: SemanticCache | None = None
+        self.strict_llm = strict_llm
+        self.max_description_chars = max_description_chars
+        self._result_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # Issues are loaded and indexed on first use, see _ensure_knowledge()
         self.jira_knowledge_manager = jira_knowledge_manager
-        self.jira_knowledge_manager.load_issues(recreate=False)
         logger.debug(f"JiraTriagerAgent initialized: storage_path={storage_path}, user_id={user_id}")
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
@@ -88,213 +339,618 @@ class JiraTriagerAgent:
         """
         return self._session_id
 
+    def _ensure_knowledge(self) -> None:
+        """Load and index the historical issues used for RAG, once."""
+        self.jira_knowledge_manager.load_issues(recreate=False)
+
+    def _ensure_storage(self) -> "SqliteStorage":
+        """Return the session storage, shared process-wide with other triagers on the same file."""
+        if self._storage is None:
+            from ._storage import get_shared_storage
+
+            self._storage = get_shared_storage(self.storage_path.resolve(), "jira_triager_sessions")
+        return self._storage
+
+    def _ensure_semantic_cache(self) -> SemanticCache | None:
+        """Open the semantic cache on first use, if enabled."""
+        if self._semantic_cache is None and self.semantic_cache_path is not None:
+            from agno.embedder.google import GeminiEmbedder
+
+            self._semantic_cache = SemanticCache(
+                self.semantic_cache_path,
+                embed=GeminiEmbedder().get_embedding,
+                threshold=self.semantic_cache_threshold,
+            )
+        return self._semantic_cache
+
+    def _lookup_triage(
+        self, current_ticket: dict[str, Any], missing_fields: list[str]
+    ) -> tuple[dict[str, Any] | None, Callable[[dict[str, Any]], None]]:
+        """Look up an earlier triage of the same ticket, or else of a near-duplicate.
+
+        Identical tickets are answered from an in-memory LRU without
+        embedding the ticket; the semantic cache is consulted on a miss.
+
+        Returns:
+            The cached triage or None, and a function storing a fresh triage for this ticket
+        """
+        digest = hashlib.blake2b(
+            f"{current_ticket.get('title', '')}\x00{current_ticket.get('description', '')}".encode(), digest_size=16
+        ).digest()
+        key = (
+            tuple(missing_fields),
+            current_ticket.get("team") or "",
+            _ticket_component(current_ticket),
+            current_ticket.get("assignee") or "",
+            current_ticket.get("project_key") or "",
+            digest,
+        )
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return dict(cached), lambda result: None
+
+        def remember(result: dict[str, Any]) -> None:
+            with self._result_cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        cached, store = self._semantic_lookup(current_ticket, missing_fields)
+        if cached is not None:
+            remember(cached)
+            return cached, store
+
+        def store_both(result: dict[str, Any]) -> None:
+            remember(result)
+            store(result)
+
+        return None, store_both
+
+    def clear_cache(self) -> None:
+        """Forget the in-memory triage results; the semantic cache is kept."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def _semantic_lookup(
+        self, current_ticket: dict[str, Any], missing_fields: list[str]
+    ) -> tuple[dict[str, Any] | None, Callable[[dict[str, Any]], None]]:
+        """Look up the triage of a near-duplicate ticket.
+
+        Only tickets with the same missing fields, team, component, assignee
+        and project are compared, since those shape the recommendation.
+
+        Returns:
+            The cached triage or None, and a function storing a fresh triage for this ticket
+        """
+        cache = self._ensure_semantic_cache()
+        if cache is None:
+            return None, lambda result: None
+
+        scope = json.dumps(
+            [
+                missing_fields,
+                str(current_ticket.get("team") or ""),
+                _ticket_component(current_ticket),
+                current_ticket.get("assignee") or "",
+                current_ticket.get("project_key") or "",
+            ]
+        )
+        text = f"{current_ticket.get('title', '')}\n{self._prompt_description(current_ticket)}"
+        try:
+            embedding = cache.embed_text(text)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed, triaging without it: {e}")
+            return None, lambda result: None
+        return cache.get(scope, embedding), lambda result: cache.put(scope, embedding, result)
+
     def initialize(self) -> None:
         """
         Initialize the agent for triage, passing the knowledge base for RAG.
+
+        Each resource is created on first use, so this is safe to call repeatedly.
         """
-        if self._initialized:
-            logger.debug("Agent already initialized")
-            return
+        self._ensure_agent()
+
+    def _ensure_agent(self) -> "Agent":
+        """Return the Agno agent, loading the knowledge and creating the shared agent on first use."""
+        if self._agent is not None:
+            return self._agent
+
+        from agno.agent import Agent
+        from agno.models.google import Gemini
+
         try:
-            logger.debug("Initializing Jira triager agent")
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            storage = SqliteStorage(
-                table_name="jira_triager_sessions",
-                db_file=str(self.storage_path),
-            )
-            # Load and parse configuration from environment (single-line JSON expected)
-            raw_allowed_teams = os.getenv("ALLOWED_TEAMS")
-            raw_component_team_map = os.getenv("COMPONENT_TEAM_MAP")
-            if not raw_allowed_teams:
-                raise ValueError("ALLOWED_TEAMS environment variable is required")
-            if not raw_component_team_map:
-                raise ValueError("COMPONENT_TEAM_MAP environment variable is required")
-
-            ALLOWED_TEAMS = json.loads(raw_allowed_teams)
-            COMPONENT_TEAM_MAP = json.loads(raw_component_team_map)
-
-            # Build a summary of the team-to-components mapping for the instructions
-            team_component_lines = []
-            for team, components in COMPONENT_TEAM_MAP.items():
-                comps_str = ", ".join(sorted(components))
-                team_component_lines.append(f"- {team}: {comps_str}")
-            team_component_map_str = "Team-to-Components Associations (not absolute, use as reference):\n" + "\n".join(
-                team_component_lines
-            )
-            self._agent = Agent(
-                name="Jira Triager Agent",
-                model=Gemini(id="gemini-2.0-flash"),
-                instructions=[
-                    "You are an expert Jira ticket triager.",
-                    "Your job is to recommend the best team and component for a new Jira issue, "
-                    "based on previous support tickets.",
-                    "",
-                    "CRITICAL REQUIREMENTS:",
-                    "1. You MUST be CONSISTENT - identical tickets should get identical assignments",
-                    "2. You MUST return a JSON object with a confidence score between 0.0 and 1.0.",
-                    '3. Format: {"team": "Team Name", "component": "Component Name", "confidence": 0.85}',
-                    "4. The confidence field is MANDATORY. Never omit it.",
-                    "",
-                    f"Only choose from the following teams: {', '.join(ALLOWED_TEAMS)}.",
-                    "You will be given a list of previous tickets (with title, description, component, team) "
-                    "and the current ticket (title, description, component, team, assignee).",
-                    "You will be provided with the allowed components for the current ticket in the prompt.",
-                    team_component_map_str,
-                    "",
-                    "CRITICAL ANALYSIS GUIDELINES:",
-                    "1. CAREFULLY read the issue title and description for specific technical keywords, "
-                    "error messages, and feature names.",
-                    "2. Match specific technical terms from the description to component names "
-                    "(e.g., 'RBAC' → 'RBAC Plugin', 'TechDocs' → 'TechDocs').",
-                    "3. AVOID overly generic components like 'Plugins' unless no more specific component fits.",
-                    "4. Prefer components that have specific technical alignment with the issue content.",
-                    "5. Look for technology stack indicators "
-                    "(React/Frontend → Frontend team, Docker/Helm → Install team).",
-                    "6. Error messages and stack traces often indicate the specific component or system involved.",
-                    "",
-                    "COMPONENT SELECTION PRIORITY:",
-                    "1. First priority: Exact feature/plugin name match (RBAC Plugin, TechDocs, Quay Plugin)",
-                    "2. Second priority: Technology-specific components "
-                    "(Authentication, Installation & Run, Dynamic plugins)",
-                    "3. Last resort: General categories (Plugins, UI, Core platform)",
-                    "",
-                    "Analyze the previous tickets for patterns and similarities to the current ticket.",
-                    "Recommend the most likely team and component for the current ticket.",
-                    "If the current ticket already has a component, team, or assignee, "
-                    "consider them when determining the best match.",
-                    "Output ONLY a JSON object with keys 'team', 'component', and 'confidence'.",
-                    "Do NOT include any explanation, markdown, or text outside the JSON.",
-                ],
-                tools=[],
-                storage=storage,
-                knowledge=self.jira_knowledge_manager._knowledge,
-            )
-            self._initialized = True
-            logger.info("Jira triager agent initialized successfully")
+            self._ensure_knowledge()
+            storage = self._ensure_storage()
+            key = self.storage_path.resolve()
+            with _agent_cache_lock:
+                agent = _AGENT_CACHE.get(key)
+                if agent is None:
+                    logger.debug("Initializing Jira triager agent")
+                    agent = Agent(
+                        name="Jira Triager Agent",
+                        model=Gemini(id=TRIAGE_MODEL_ID),
+                        instructions=_build_instructions(),
+                        tools=[],
+                        storage=storage,
+                        # Gemini cannot combine function calls with a response schema, so similar
+                        # tickets are retrieved up front and put in the prompt instead of being
+                        # searched through the knowledge tool
+                        search_knowledge=False,
+                        response_model=TriageRecommendation,
+                    )
+                    _AGENT_CACHE[key] = agent
+                    logger.info("Jira triager agent initialized successfully")
+            self._agent = agent
+            return agent
         except Exception as e:
             logger.error(f"Failed to initialize Jira triager agent: {e}")
-            self._initialized = False
+            self._agent = None
             raise RuntimeError(f"Agent initialization failed: {e}") from e
 
-    def triage_ticket(
-        self,
-        current_ticket: dict[str, Any],
-        session_id: str | None = None,
-    ) -> dict[str, str]:
-        """
-        Recommend the missing team or component for a Jira ticket using RAG.
-
-        Args:
-            current_ticket: Dict with current ticket fields (title, description, component, team)
-            session_id: Optional session ID to use for this triage
-
-        Returns:
-            Dict with only the missing field(s) assigned (e.g., {"team": ...} or {"component": ...} or both)
-        """
-        if not self._initialized:
-            self.initialize()
-        if self._agent is None:
-            raise RuntimeError("Agent not properly initialized")
+    def _resolve_session(self, session_id: str | None) -> str:
+        """Select the session for a triage, creating one if none is active."""
         if session_id is not None:
             self._session_id = session_id
         elif self._session_id is None:
             self.create_session()
         logger.debug(f"Triaging ticket with session_id={self._session_id}")
+        return self._session_id
 
+    def _copy_agent(self, response_model: type[BaseModel]) -> "Agent":
+        """Return a copy of the shared agent for one run, sharing its storage."""
+        agent = self._ensure_agent()
+        return agent.deep_copy(update={"storage": agent.storage, "response_model": response_model})
+
+    def _missing_fields(self, current_ticket: dict[str, Any]) -> list[str]:
+        """Return the fields the triage has to recommend, logging when there are none."""
         # Determine which fields are missing (treat None and '' as missing)
         missing_fields = [field for field in ("team", "component") if not current_ticket.get(field)]
-
         if not missing_fields:
             key = current_ticket.get("key")
             logger.info(f"No fields to assign for {key}; both team and component are already set.")
-            return {}
+        return missing_fields
+
+    def _configured_triage(self, current_ticket: dict[str, Any], missing_fields: list[str]) -> dict[str, Any] | None:
+        """Return the triage the team configuration dictates, if any, without asking the model.
+
+        A missing team is the assignee's team, or else the only team associated
+        with the ticket's component. A missing component is the only component
+        of the ticket's team, if the project has it. The team-to-components map
+        is only a reference, so answers derived from it get
+        COMPONENT_MAP_CONFIDENCE rather than full confidence.
+        """
+        if self.strict_llm or len(missing_fields) != 1:
+            return None
+        if missing_fields == ["team"]:
+            team = _assignee_to_team().get((current_ticket.get("assignee") or "").strip())
+            confidence = 1.0
+            if team is None:
+                teams = _component_to_teams().get(_ticket_component(current_ticket), ())
+                team = teams[0] if len(teams) == 1 else None
+                confidence = COMPONENT_MAP_CONFIDENCE
+            if team is not None:
+                logger.debug(f"Team of {current_ticket.get('key')} determined by configuration: {team}")
+                return {"team": team, "confidence": confidence}
+            return None
+
+        from sidekick.utils.jira_client_utils import get_project_component_names
+
+        components = _component_team_map().get(current_ticket.get("team") or "", ())
+        if len(components) == 1 and components[0] in get_project_component_names(_project_key(current_ticket)):
+            logger.debug(f"Component of {current_ticket.get('key')} determined by configuration: {components[0]}")
+            return {"component": components[0], "confidence": COMPONENT_MAP_CONFIDENCE}
+        return None
+
+    def _build_triage_prompt(self, current_ticket: dict[str, Any], missing_fields: list[str]) -> str:
+        """Build the prompt asking for the missing field(s) of a ticket."""
+        from sidekick.utils.jira_client_utils import get_project_component_names
 
         # Build a focused prompt for the current ticket only
-        component = current_ticket.get("component")
-        project_key = current_ticket.get("project_key") or "RHIDP"
-        allowed_components = get_project_component_names(project_key)
+        allowed_components = tuple(get_project_component_names(_project_key(current_ticket)))
+        team = current_ticket.get("team")
+        if missing_fields == ["component"] and team:
+            # Offer only the team's components, unless none of them exist in the project
+            team_components = frozenset(_component_team_map().get(team, ()))
+            allowed_components = (
+                tuple(name for name in allowed_components if name in team_components) or allowed_components
+            )
+        return "\n".join(
+            (_allowed_components_line(allowed_components), *self._ticket_prompt_lines(current_ticket, missing_fields))
+        )
+
+    def _build_group_prompt(self, group: list[tuple[dict[str, Any], list[str]]]) -> str:
+        """Build one prompt asking for the missing field(s) of several tickets of the same project."""
+        from sidekick.utils.jira_client_utils import get_project_component_names
+
+        allowed_components = tuple(get_project_component_names(_project_key(group[0][0])))
+        prompt_lines = [
+            _allowed_components_line(allowed_components),
+            f"Triage each of the following {len(group)} tickets independently and return one recommendation "
+            "per ticket, with the ticket's id.",
+        ]
+        for ticket_id, (current_ticket, missing_fields) in enumerate(group):
+            prompt_lines.append(f"--- Ticket id {ticket_id} ---")
+            prompt_lines.extend(self._ticket_prompt_lines(current_ticket, missing_fields))
+        return "\n".join(prompt_lines)
 
-        prompt_lines = [f"Allowed components: {allowed_components}"]
+    def _prompt_description(self, current_ticket: dict[str, Any]) -> str:
+        """Return the ticket's cleaned description, truncated to max_description_chars.
+
+        Input tokens drive Gemini's cost and latency, and real descriptions can
+        run to tens of kilobytes of logs and stack traces. Truncating trades the
+        rare signal deep in a description for a bounded prompt; the marker tells
+        the model the text was cut.
+        """
+        from sidekick.utils.jira_client_utils import clean_jira_description
+
+        description = clean_jira_description(current_ticket.get("description", ""))
+        if len(description) > self.max_description_chars:
+            return description[: self.max_description_chars] + "…[truncated]"
+        return description
+
+    def _reference_ticket(self, document: str) -> str:
+        """Compact JSON of a historical ticket's triage-relevant fields, with its description truncated."""
+        issue = json.loads(document)
+        fields = {field: issue[field] for field in _REFERENCE_FIELDS if issue.get(field)}
+        if "description" in fields:
+            fields["description"] = self._prompt_description(fields)
+        return json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+
+    def _ticket_prompt_lines(self, current_ticket: dict[str, Any], missing_fields: list[str]) -> list[str]:
+        """Describe a ticket, its similar historical tickets and its missing field(s) for a prompt."""
+        prompt_lines = []
+        component = _ticket_component(current_ticket)
         if component:
             prompt_lines.append(f"Current component: {component}")
 
         # If there is an assignee, add a note about their team
         assignee = current_ticket.get("assignee")
         if assignee:
-            prompt_lines.append(self._get_assignee_team_info(assignee))
+            prompt_lines.append(_assignee_team_info(assignee))
 
+        title = current_ticket.get("title", "")
+        description = self._prompt_description(current_ticket)
         prompt_lines.extend(
-            [
+            (
+                "Similar historical tickets:",
+                *map(
+                    self._reference_ticket,
+                    self.jira_knowledge_manager.search_issues(
+                        f"{title}\n{description}", num_documents=SIMILAR_TICKETS_LIMIT, component=component
+                    ),
+                ),
                 "Given the current Jira ticket:",
-                f"Title: {current_ticket.get('title', '')}",
-                f"Description: {clean_jira_description(current_ticket.get('description', ''))}",
+                f"Title: {title}",
+                f"Description: {description}",
                 f"The current ticket is missing the following field(s): {missing_fields}.",
-                "",
-                "ANALYSIS PROCESS:",
-                "1. EXAMINE the historical tickets retrieved from the knowledge base",
-                "2. IDENTIFY tickets with similar titles, descriptions, or technical keywords",
-                "3. ANALYZE patterns in team/component assignments for similar issues",
-                "4. EXTRACT common technical terms, error types, and feature names",
-                "5. APPLY learned patterns to recommend the most appropriate assignment",
-                "",
-                "ASSIGNMENT STRATEGY:",
-                "- Find the most similar historical tickets and note their assignments",
-                "- Look for exact keyword matches (plugin names, error types, technologies)",
-                "- Prefer specific components over generic ones (avoid 'Plugins' unless necessary)",
-                "- Consider the technical domain (frontend/UI, backend/API, infrastructure, security)",
-                "- Weight assignments from very similar tickets more heavily",
-                "",
-                "REASONING REQUIREMENT:",
-                "- Base your decision on specific examples from retrieved historical tickets",
-                "- Mention which similar tickets influenced your decision",
-                "- Explain the key technical indicators that led to your choice",
-                "",
-                "CONFIDENCE SCORING GUIDELINES:",
-                "- 0.9-1.0: Very similar tickets with exact keyword matches and clear patterns",
-                "- 0.7-0.8: Similar tickets with good keyword overlap and consistent assignments",
-                "- 0.5-0.6: Some similarity but mixed patterns or limited historical data",
-                "- 0.3-0.4: Weak similarity, mostly educated guessing based on limited patterns",
-                "- 0.1-0.2: Very uncertain, no clear similar tickets found",
-                "",
-                "Use any assigned field(s) (component, team, assignee) as context to help "
-                "determine the best match for the missing field(s).",
-                "",
-                "OUTPUT FORMAT - CRITICAL REQUIREMENT:",
-                "You MUST return a JSON object with the following structure:",
-                '- If recommending team only: {"team": "Team Name", "confidence": 0.85}',
-                '- If recommending component only: {"component": "Component Name", "confidence": 0.85}',
-                '- If recommending both: {"team": "Team Name", "component": "Component Name", "confidence": 0.85}',
-                "",
-                "The confidence field is MANDATORY and must be a float between 0.0 and 1.0.",
-                "Do not include fields that are already assigned.",
-            ]
+            )
         )
-        prompt = "\n".join(prompt_lines)
-        response = self._agent.run(prompt, stream=False, session_id=self._session_id, user_id=self.user_id)
-        # Parse the response for the JSON object
-        import json
-
-        content = response.content if response.content is not None else "{}"
-        # Remove Markdown code block markers if present
-        clean_content = re.sub(r"^```(?:json)?\s*|\s*```$", "", content.strip(), flags=re.IGNORECASE | re.MULTILINE)
+        return prompt_lines
+
+    def _parse_triage_response(
+        self,
+        content: TriageRecommendation | str | None,
+        current_ticket: dict[str, Any],
+        missing_fields: list[str],
+    ) -> dict[str, str]:
+        """Extract the recommended missing field(s) and confidence from the agent's reply.
+
+        Raises:
+            RuntimeError: If the reply cannot be parsed or recommends a team or
+                component that is not allowed
+        """
         try:
-            result = json.loads(clean_content)
-            return {k: v for k, v in result.items() if k in missing_fields or k == "confidence"}
+            if isinstance(content, BaseModel):
+                result = content.model_dump(exclude_none=True)
+            else:
+                # Agno hands back the raw text if it could not validate the reply
+                result = json.loads(content if content is not None else "{}")
+            keep = frozenset((*missing_fields, "confidence"))
+            result = {k: v for k, v in result.items() if k in keep}
         except Exception as e:
-            logger.error(f"Failed to parse agent response: {e}\nResponse: {response.content}")
+            logger.error(f"Failed to parse agent response: {e}\nResponse: {content}")
             raise RuntimeError(f"Failed to parse agent response: {e}") from e
 
-    def _get_assignee_team_info(self, assignee: str) -> str:
-        if not assignee:
-            return ""
-        raw_team_assignee_map = os.getenv("TEAM_ASSIGNEE_MAP")
-        if not raw_team_assignee_map:
-            raise ValueError("TEAM_ASSIGNEE_MAP environment variable is required")
-        TEAM_ASSIGNEE_MAP = json.loads(raw_team_assignee_map)
-        for team, members in TEAM_ASSIGNEE_MAP.items():
-            if any(assignee.strip() == m.strip() for m in members):
-                return (
-                    f"The current assignee ('{assignee}') is a member of the team '{team}'. "
-                    "Assign the ticket to this team."
-                )
-        return ""
+        from sidekick.utils.jira_client_utils import get_project_component_set
+
+        team = result.get("team")
+        if team is not None and team not in _allowed_team_set():
+            raise RuntimeError(f"Agent recommended team {team!r}, which is not an allowed team")
+        component = result.get("component")
+        if component is not None:
+            allowed_components = get_project_component_set(_project_key(current_ticket))
+            # An empty set means the project's components could not be fetched
+            if allowed_components and component not in allowed_components:
+                raise RuntimeError(f"Agent recommended component {component!r}, which is not in the project")
+        return result
+
+    def _parse_group_response(
+        self, content: GroupTriageRecommendation | str | None, group: list[tuple[dict[str, Any], list[str]]]
+    ) -> list[dict[str, str] | Exception]:
+        """Dispatch the recommendations of a grouped triage back to its tickets by id."""
+        try:
+            if not isinstance(content, GroupTriageRecommendation):
+                # Agno hands back the raw text if it could not validate the reply
+                content = GroupTriageRecommendation.model_validate_json(content or "{}")
+        except Exception as e:
+            logger.error(f"Failed to parse agent response: {e}\nResponse: {content}")
+            raise RuntimeError(f"Failed to parse agent response: {e}") from e
+        by_id = {recommendation.id: recommendation for recommendation in content.recommendations}
+        results: list[dict[str, str] | Exception] = []
+        for ticket_id, (current_ticket, missing_fields) in enumerate(group):
+            recommendation = by_id.get(ticket_id)
+            if recommendation is None:
+                key = current_ticket.get("key", ticket_id)
+                results.append(RuntimeError(f"Agent response has no recommendation for ticket {key}"))
+            else:
+                try:
+                    results.append(self._parse_triage_response(recommendation, current_ticket, missing_fields))
+                except RuntimeError as e:
+                    results.append(e)
+        return results
+
+    def triage_ticket(
+        self,
+        current_ticket: dict[str, Any],
+        session_id: str | None = None,
+    ) -> dict[str, str]:
+        """
+        Recommend the missing team or component for a Jira ticket using RAG.
+
+        Args:
+            current_ticket: Dict with current ticket fields (title, description, component, team)
+            session_id: Optional session ID to use for this triage
+
+        Returns:
+            Dict with only the missing field(s) assigned (e.g., {"team": ...} or {"component": ...} or both)
+        """
+        session_id = self._resolve_session(session_id)
+        missing_fields = self._missing_fields(current_ticket)
+        if not missing_fields:
+            return {}
+
+        configured = self._configured_triage(current_ticket, missing_fields)
+        if configured is not None:
+            return configured
+
+        cached, store = self._lookup_triage(current_ticket, missing_fields)
+        if cached is not None:
+            return cached
+
+        # The shared agent keeps per-run state, so concurrent triages each run on a copy
+        agent = self._copy_agent(TriageRecommendation)
+        prompt = self._build_triage_prompt(current_ticket, missing_fields)
+        response = agent.run(prompt, stream=False, session_id=session_id, user_id=self.user_id)
+        result = self._parse_triage_response(response.content, current_ticket, missing_fields)
+        store(result)
+        return result
+
+    async def atriage_ticket(
+        self,
+        current_ticket: dict[str, Any],
+        session_id: str | None = None,
+    ) -> dict[str, str]:
+        """
+        Async variant of triage_ticket(), so several triages can overlap their model calls.
+
+        Args:
+            current_ticket: Dict with current ticket fields (title, description, component, team)
+            session_id: Optional session ID to use for this triage
+
+        Returns:
+            Dict with only the missing field(s) assigned (e.g., {"team": ...} or {"component": ...} or both)
+        """
+        session_id = self._resolve_session(session_id)
+        missing_fields = self._missing_fields(current_ticket)
+        if not missing_fields:
+            return {}
+
+        # Resolving allowed components and embedding the ticket make HTTP calls; keep them off the event loop
+        configured = await asyncio.to_thread(self._configured_triage, current_ticket, missing_fields)
+        if configured is not None:
+            return configured
+        cached, store = await asyncio.to_thread(self._lookup_triage, current_ticket, missing_fields)
+        if cached is not None:
+            return cached
+
+        # The shared agent keeps per-run state, so concurrent triages each run on a copy
+        agent = self._copy_agent(TriageRecommendation)
+        prompt = await asyncio.to_thread(self._build_triage_prompt, current_ticket, missing_fields)
+        response = await agent.arun(prompt, stream=False, session_id=session_id, user_id=self.user_id)
+        result = self._parse_triage_response(response.content, current_ticket, missing_fields)
+        store(result)
+        return result
+
+    async def triage_batch(
+        self,
+        tickets: list[dict[str, Any]],
+        concurrency: int = 20,
+        batch_size: int = 10,
+    ) -> list[dict[str, str] | BaseException]:
+        """
+        Triage several tickets concurrently, several tickets per model call.
+
+        Tickets without missing fields or with a cached triage are answered
+        without the model. The rest are grouped by project, since allowed
+        components are per project, and each group of up to ``batch_size``
+        tickets is triaged in a single prompt. An Agno agent keeps per-run
+        state, so each call runs on its own copy of the agent, in its own
+        session, sharing its storage.
+
+        Args:
+            tickets: Ticket dicts as accepted by triage_ticket()
+            concurrency: Maximum number of model calls in flight at once
+            batch_size: Maximum number of tickets per model call
+
+        Returns:
+            For each ticket, its recommendation or the exception raised while triaging it
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        results: list[dict[str, str] | BaseException] = [{} for _ in tickets]
+        pending: dict[str, list[tuple[int, list[str], Callable[[dict[str, Any]], None]]]] = {}
+
+        async def look_up(index: int, ticket: dict[str, Any]) -> None:
+            missing_fields = self._missing_fields(ticket)
+            if not missing_fields:
+                return
+            try:
+                async with semaphore:
+                    # Resolving allowed components and embedding the ticket make HTTP calls
+                    configured = await asyncio.to_thread(self._configured_triage, ticket, missing_fields)
+                    if configured is not None:
+                        results[index] = configured
+                        return
+                    cached, store = await asyncio.to_thread(self._lookup_triage, ticket, missing_fields)
+            except Exception as e:
+                results[index] = e
+                return
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(_project_key(ticket), []).append((index, missing_fields, store))
+
+        await asyncio.gather(*(look_up(index, ticket) for index, ticket in enumerate(tickets)))
+
+        async def triage_group(group: list[tuple[int, list[str], Callable[[dict[str, Any]], None]]]) -> None:
+            async with semaphore:
+                try:
+                    session_id = self._generate_session_id()
+                    if len(group) == 1:
+                        index, missing_fields, _ = group[0]
+                        agent = self._copy_agent(TriageRecommendation)
+                        prompt = await asyncio.to_thread(self._build_triage_prompt, tickets[index], missing_fields)
+                        response = await agent.arun(prompt, stream=False, session_id=session_id, user_id=self.user_id)
+                        group_results = [self._parse_triage_response(response.content, tickets[index], missing_fields)]
+                    else:
+                        prompt_group = [(tickets[index], missing_fields) for index, missing_fields, _ in group]
+                        agent = self._copy_agent(GroupTriageRecommendation)
+                        prompt = await asyncio.to_thread(self._build_group_prompt, prompt_group)
+                        response = await agent.arun(prompt, stream=False, session_id=session_id, user_id=self.user_id)
+                        group_results = self._parse_group_response(response.content, prompt_group)
+                except Exception as e:
+                    group_results = [e] * len(group)
+            for (index, _, store), result in zip(group, group_results, strict=True):
+                if not isinstance(result, BaseException):
+                    store(result)
+                results[index] = result
+
+        # Group tickets in their original order, whichever lookup finished first
+        for project_tickets in pending.values():
+            project_tickets.sort(key=lambda item: item[0])
+        await asyncio.gather(
+            *(
+                triage_group(project_tickets[start : start + batch_size])
+                for project_tickets in pending.values()
+                for start in range(0, len(project_tickets), batch_size)
+            )
+        )
+        return results
+
+    def triage_tickets(
+        self,
+        tickets: list[dict[str, Any]],
+        concurrency: int = 20,
+        batch_size: int = 10,
+    ) -> list[dict[str, str] | BaseException]:
+        """
+        Synchronous wrapper around triage_batch() for callers without an event loop.
+
+        Args:
+            tickets: Ticket dicts as accepted by triage_ticket()
+            concurrency: Maximum number of model calls in flight at once
+            batch_size: Maximum number of tickets per model call
+
+        Returns:
+            For each ticket, its recommendation or the exception raised while triaging it
+        """
+        return asyncio.run(self.triage_batch(tickets, concurrency=concurrency, batch_size=batch_size))
+
+    def submit_batch_triage(self, tickets: list[dict[str, Any]]) -> str:
+        """
+        Submit tickets for triage through the Gemini Batch API.
+
+        Batch jobs are billed at a discount and do not count against the
+        interactive rate limits, but may take hours to complete, so this is
+        meant for backlog triage that does not wait for the answer. Poll the
+        job with poll_batch_triage(), passing the same tickets.
+
+        Args:
+            tickets: Ticket dicts as accepted by triage_ticket()
+
+        Returns:
+            Name of the batch job
+        """
+        self._ensure_knowledge()
+        config = {
+            "system_instruction": _build_instructions(),
+            "response_mime_type": "application/json",
+            "response_schema": TriageRecommendation,
+        }
+        requests = []
+        for ticket in tickets:
+            missing_fields = self._missing_fields(ticket)
+            if missing_fields:
+                prompt = self._build_triage_prompt(ticket, missing_fields)
+                requests.append({"contents": [{"role": "user", "parts": [{"text": prompt}]}], "config": config})
+        if not requests:
+            raise ValueError("None of the tickets has a missing team or component")
+
+        job = (
+            self._ensure_agent()
+            .model.get_client()
+            .batches.create(
+                model=TRIAGE_MODEL_ID,
+                src=requests,
+                config={"display_name": f"jira-triage-{self._generate_session_id()}"},
+            )
+        )
+        logger.info(f"Submitted batch triage job {job.name} for {len(requests)} ticket(s)")
+        return job.name
+
+    def poll_batch_triage(
+        self, job_name: str, tickets: list[dict[str, Any]]
+    ) -> list[dict[str, str] | BaseException] | None:
+        """
+        Collect the results of a batch triage job.
+
+        Args:
+            job_name: Name returned by submit_batch_triage()
+            tickets: The tickets the job was submitted for, in the same order
+
+        Returns:
+            For each ticket, its recommendation or the error it failed with, or
+            None while the job is still running
+
+        Raises:
+            RuntimeError: If the job failed, was cancelled or expired
+            ValueError: If the tickets do not match the job's requests
+        """
+        job = self._ensure_agent().model.get_client().batches.get(name=job_name)
+        state = job.state.name
+        if state in _FAILED_BATCH_STATES:
+            raise RuntimeError(f"Batch triage job {job_name} ended in state {state}: {job.error}")
+        if state != "JOB_STATE_SUCCEEDED":
+            logger.debug(f"Batch triage job {job_name} is {state}")
+            return None
+
+        missing_per_ticket = [self._missing_fields(ticket) for ticket in tickets]
+        responses = iter(job.dest.inlined_responses)
+        if sum(map(bool, missing_per_ticket)) != len(job.dest.inlined_responses):
+            raise ValueError(f"Tickets do not match the {len(job.dest.inlined_responses)} requests of job {job_name}")
+        results: list[dict[str, str] | BaseException] = []
+        for ticket, missing_fields in zip(tickets, missing_per_ticket, strict=True):
+            if not missing_fields:
+                results.append({})
+                continue
+            inlined = next(responses)
+            if inlined.error is not None:
+                results.append(RuntimeError(f"Batch triage failed: {inlined.error}"))
+                continue
+            try:
+                results.append(self._parse_triage_response(inlined.response.text, ticket, missing_fields))
+            except RuntimeError as e:
+                results.append(e)
+        return results
@@ -5,9 +5,28 @@ This module provides reusable mixins that eliminate code duplication across agen
 Mixins follow single responsibility principle and can be composed as needed.
 """
 
-from .jira_mixin import JiraMixin
-from .knowledge_mixin import KnowledgeMixin
-from .storage_mixin import StorageMixin
-from .workspace_mixin import WorkspaceMixin
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .jira_mixin import JiraMixin
+    from .knowledge_mixin import KnowledgeMixin
+    from .storage_mixin import StorageMixin
+    from .workspace_mixin import WorkspaceMixin
 
 __all__ = ["JiraMixin", "KnowledgeMixin", "StorageMixin", "WorkspaceMixin"]
+
+_EXPORTS = {
+    "JiraMixin": ".jira_mixin",
+    "KnowledgeMixin": ".knowledge_mixin",
+    "StorageMixin": ".storage_mixin",
+    "WorkspaceMixin": ".workspace_mixin",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Only load the mixins an agent asks for; the knowledge mixin in particular
+    # is not needed by agents that never touch the vector store.
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
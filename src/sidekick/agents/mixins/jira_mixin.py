@@ -5,68 +5,116 @@ Provides common functionality for MCP Atlassian server integration, including
 command building, environment setup, and tool lifecycle management.
 """
 
-from os import getenv
+import hashlib
+import json
+import shutil
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
 
-from agno.tools.mcp import MCPTools
 from loguru import logger
 
+from ..env import get_agent_env, log_agent_env_status
+
+if TYPE_CHECKING:
+    from agno.tools.mcp import MCPTools
+
+
+# MCP Atlassian tools exposed to the agents
+_MCP_INCLUDED_TOOLS = ("jira_get_issue", "jira_search")
+
+# Server environment that does not depend on credentials
+_MCP_STATIC_ENV = MappingProxyType({"ENABLED_TOOLS": ",".join(_MCP_INCLUDED_TOOLS)})
+
+
+@lru_cache(maxsize=1)
+def _resolve_mcp_command() -> str:
+    """Resolve the command used to launch the MCP Atlassian server.
+
+    Prefers an installed ``mcp-atlassian`` executable, which starts directly,
+    over ``uvx`` which resolves and prepares an environment on every launch.
+    """
+    executable = shutil.which("mcp-atlassian")
+    if executable:
+        return f"{executable} -v"
+    return "uvx mcp-atlassian -v"
+
+
+@lru_cache(maxsize=4)
+def _mcp_server_config(
+    jira_url: str | None, jira_token: str | None, read_only_mode: bool
+) -> tuple[str, MappingProxyType[str, str], tuple[str, ...]]:
+    """Validate and build the MCP Atlassian server config, once per set of credentials.
+
+    Raises:
+        ValueError: If the Jira URL or token is missing
+    """
+    if not jira_url:
+        raise ValueError("JIRA_URL environment variable is required for MCP integration")
+
+    if not jira_token:
+        raise ValueError("JIRA_PERSONAL_TOKEN environment variable is required for MCP integration")
+
+    # Build environment dictionary for MCP server
+    mcp_env = MappingProxyType(
+        {
+            **_MCP_STATIC_ENV,
+            "JIRA_URL": jira_url,
+            "JIRA_PERSONAL_TOKEN": jira_token,
+            "READ_ONLY_MODE": "true" if read_only_mode else "false",
+        }
+    )
+    command = _resolve_mcp_command()
+
+    # Brace-style arguments are only formatted when debug logging is enabled
+    logger.debug("MCP command: {}", command)
+    logger.debug("MCP environment: {}", list(mcp_env))  # Log keys only, not values
+    logger.debug("MCP included tools: {}", _MCP_INCLUDED_TOOLS)
+    logger.debug("MCP read-only mode: {}", read_only_mode)
+
+    return command, mcp_env, _MCP_INCLUDED_TOOLS
+
 
 class JiraMixin:
     """Mixin for JIRA MCP integration functionality."""
 
-    def __init__(self, *args, read_only_mode: bool = True, **kwargs):
+    # Started MCP servers shared across agent sessions in this process, keyed by
+    # a hash of the server config, with the number of sessions using each one
+    _shared_mcp_tools: ClassVar[dict[str, "MCPTools"]] = {}
+    _shared_mcp_refcounts: ClassVar[dict[str, int]] = {}
+    _mcp_cache_stats: ClassVar[dict[str, int]] = {"hits": 0, "misses": 0}
+
+    def __init__(self, *args, read_only_mode: bool = True, mcp_cache_ttl_seconds: float = 3600, **kwargs):
         """Initialize JIRA mixin.
 
         Args:
             read_only_mode: Whether to use read-only mode for JIRA access
+            mcp_cache_ttl_seconds: How long cached MCP tool schemas are reused
             *args: Passed to super().__init__()
             **kwargs: Passed to super().__init__()
         """
         super().__init__(*args, **kwargs)
         self.read_only_mode = read_only_mode
-        logger.debug(f"JiraMixin initialized: read_only_mode={read_only_mode}")
+        self.mcp_cache_ttl_seconds = mcp_cache_ttl_seconds
+        logger.debug("JiraMixin initialized: read_only_mode={}", read_only_mode)
 
     def build_mcp_command(self) -> tuple[str, dict[str, str], list[str]]:
         """Build the MCP command configuration for the Atlassian server.
 
+        The config is validated and built once per set of credentials; callers
+        get their own copies of the environment and tool list.
+
         Returns:
             Tuple of (command, environment_dict, included_tools)
 
         Raises:
             ValueError: If required environment variables are missing
         """
-        # Get environment variables
-        jira_url = getenv("JIRA_URL")
-        jira_token = getenv("JIRA_PERSONAL_TOKEN")
-
-        if not jira_url:
-            raise ValueError("JIRA_URL environment variable is required for MCP integration")
+        env = get_agent_env()
+        command, mcp_env, included_tools = _mcp_server_config(env.jira_url, env.jira_token, self.read_only_mode)
+        return command, dict(mcp_env), list(included_tools)
 
-        if not jira_token:
-            raise ValueError("JIRA_PERSONAL_TOKEN environment variable is required for MCP integration")
-
-        # Build environment dictionary for MCP server
-        mcp_env = {
-            "JIRA_URL": jira_url,
-            "JIRA_PERSONAL_TOKEN": jira_token,
-            "READ_ONLY_MODE": "true" if self.read_only_mode else "false",
-            "ENABLED_TOOLS": "jira_get_issue,jira_search",
-        }
-
-        # Define the tools we want to include
-        included_tools = ["jira_get_issue", "jira_search"]
-
-        # Build the command
-        command = "uvx mcp-atlassian -v"
-
-        logger.debug(f"MCP command: {command}")
-        logger.debug(f"MCP environment: {list(mcp_env.keys())}")  # Log keys only, not values
-        logger.debug(f"MCP included tools: {included_tools}")
-        logger.debug(f"MCP read-only mode: {self.read_only_mode}")
-
-        return command, mcp_env, included_tools
-
-    def create_mcp_tools(self) -> MCPTools:
+    def create_mcp_tools(self) -> "MCPTools":
         """Create and return configured MCP tools for Jira integration.
 
         Returns:
@@ -75,6 +123,8 @@ class JiraMixin:
         Raises:
             ValueError: If required environment variables are missing
         """
+        from agno.tools.mcp import MCPTools
+
         command, mcp_env, included_tools = self.build_mcp_command()
 
         return MCPTools(
@@ -92,33 +142,93 @@ class JiraMixin:
         return ["JIRA_URL", "JIRA_PERSONAL_TOKEN"]
 
     def log_jira_env_status(self) -> None:
-        """Log the status of required JIRA environment variables."""
-        jira_url = getenv("JIRA_URL")
-        jira_token = getenv("JIRA_PERSONAL_TOKEN")
-        github_token = getenv("GITHUB_ACCESS_TOKEN")
+        """Log the status of required JIRA environment variables (once per process)."""
+        log_agent_env_status()
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, int]:
+        """Return hit/miss counters of the shared MCP server cache.
+
+        Returns:
+            Dictionary with "hits", "misses" and currently "active" servers
+        """
+        return {**cls._mcp_cache_stats, "active": len(cls._shared_mcp_tools)}
+
+    def _mcp_cache_key(self, command: str, mcp_env: dict[str, str], included_tools: list[str]) -> str:
+        """Build the key under which a started MCP server is shared.
 
-        logger.info(f"JIRA_URL: {'set' if jira_url else 'NOT SET'}")
-        logger.info(f"JIRA_PERSONAL_TOKEN: {'set' if jira_token else 'NOT SET'}")
-        logger.info(f"GITHUB_ACCESS_TOKEN: {'set' if github_token else 'NOT SET'}")
+        The canonical config is hashed so credentials are not kept in the key.
+        """
+        config = json.dumps({"cmd": command, "env": mcp_env, "tools": included_tools}, sort_keys=True)
+        return hashlib.sha256(config.encode()).hexdigest()
 
-    async def setup_mcp_context(self) -> MCPTools:
+    async def setup_mcp_context(self) -> "MCPTools":
         """Setup async context - create and start MCP tools.
 
+        Started MCP servers are shared between sessions with the same
+        configuration, so the server subprocess is only spawned once. Tool
+        schemas are cached on disk so a new server skips listing its tools.
+
         Returns:
             Started MCPTools instance
         """
-        mcp_tools = self.create_mcp_tools()
-        await mcp_tools.__aenter__()
+        from ...tools.mcp_cache import CachedMCPTools, tool_cache_key
+
+        command, mcp_env, included_tools = self.build_mcp_command()
+        key = self._mcp_cache_key(command, mcp_env, included_tools)
+
+        mcp_tools = JiraMixin._shared_mcp_tools.get(key)
+        if mcp_tools is None:
+            JiraMixin._mcp_cache_stats["misses"] += 1
+            mcp_tools = CachedMCPTools(
+                command=command,
+                env=mcp_env,
+                include_tools=included_tools,
+                cache_key=tool_cache_key(command, mcp_env, included_tools),
+                cache_ttl_seconds=self.mcp_cache_ttl_seconds,
+            )
+            try:
+                await mcp_tools.__aenter__()
+            except BaseException as e:
+                # Reap the server subprocess if initialization failed part-way
+                await mcp_tools.__aexit__(type(e), e, e.__traceback__)
+                raise
+            # Another session may have started the same server while we awaited;
+            # keep a single shared instance in that case
+            if key in JiraMixin._shared_mcp_tools:
+                await mcp_tools.__aexit__(None, None, None)
+                mcp_tools = JiraMixin._shared_mcp_tools[key]
+            else:
+                JiraMixin._shared_mcp_tools[key] = mcp_tools
+            logger.debug("Started shared MCP server")
+        else:
+            JiraMixin._mcp_cache_stats["hits"] += 1
+            logger.debug("Reusing shared MCP server")
+
+        JiraMixin._shared_mcp_refcounts[key] = JiraMixin._shared_mcp_refcounts.get(key, 0) + 1
         return mcp_tools
 
-    async def cleanup_mcp_context(self, mcp_tools: MCPTools) -> None:
-        """Cleanup async context - stop MCP tools.
+    async def cleanup_mcp_context(self, mcp_tools: "MCPTools") -> None:
+        """Cleanup async context - release MCP tools.
+
+        Shared MCP servers are only stopped once the last session using them
+        has been cleaned up.
 
         Args:
             mcp_tools: MCPTools instance to cleanup
         """
-        if mcp_tools:
-            try:
-                await mcp_tools.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error cleaning up MCP tools: {e}")
+        if not mcp_tools:
+            return
+
+        key = next((k for k, v in JiraMixin._shared_mcp_tools.items() if v is mcp_tools), None)
+        if key is not None:
+            JiraMixin._shared_mcp_refcounts[key] -= 1
+            if JiraMixin._shared_mcp_refcounts[key] > 0:
+                return
+            del JiraMixin._shared_mcp_tools[key]
+            del JiraMixin._shared_mcp_refcounts[key]
+
+        try:
+            await mcp_tools.__aexit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"Error cleaning up MCP tools: {e}")
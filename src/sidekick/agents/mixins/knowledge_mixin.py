@@ -6,12 +6,12 @@ and knowledge-related operations.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from agno.tools.knowledge import KnowledgeTools
 from loguru import logger
 
-from ...knowledge import KnowledgeManager
+if TYPE_CHECKING:
+    from agno.tools.knowledge import KnowledgeTools
 
 
 class KnowledgeMixin:
@@ -26,6 +26,9 @@ class KnowledgeMixin:
             **kwargs: Passed to super().__init__()
         """
         super().__init__(*args, **kwargs)
+        # The knowledge manager loads LanceDB and the embedders; import it with the first agent that needs it
+        from ...knowledge import KnowledgeManager
+
         self.knowledge_manager = KnowledgeManager(knowledge_path=knowledge_path)
         self._knowledge: Any = None  # Will be loaded during setup
         logger.debug(f"KnowledgeMixin initialized: knowledge_path={knowledge_path}")
@@ -56,7 +59,7 @@ class KnowledgeMixin:
         self._knowledge = self.knowledge_manager.load_knowledge(recreate=recreate)
         return self._knowledge
 
-    def create_knowledge_tools(self, knowledge: Any | None = None) -> KnowledgeTools:
+    def create_knowledge_tools(self, knowledge: Any | None = None) -> "KnowledgeTools":
         """Create and return configured KnowledgeTools.
 
         Args:
@@ -72,6 +75,8 @@ class KnowledgeMixin:
         if knowledge_to_use is None:
             raise RuntimeError("Knowledge base not loaded. Call load_knowledge() first.")
 
+        from agno.tools.knowledge import KnowledgeTools
+
         return KnowledgeTools(
             knowledge=knowledge_to_use,
             think=True,
@@ -5,10 +5,16 @@ Provides common functionality for SQLite storage creation with custom table nami
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from agno.storage.sqlite import SqliteStorage
 from loguru import logger
 
+# SQLAlchemy and the agno storage backend are only loaded once a storage is created
+if TYPE_CHECKING:
+    from agno.storage.sqlite import SqliteStorage
+
+    from .._storage import BatchingSqliteStorage
+
 
 class StorageMixin:
     """Mixin for storage creation and management."""
@@ -23,25 +29,38 @@ class StorageMixin:
         """
         super().__init__(*args, **kwargs)
         self.storage_path = storage_path
-        logger.debug(f"StorageMixin initialized: storage_path={storage_path}")
+        self._storages: list[BatchingSqliteStorage] = []
+        logger.debug("StorageMixin initialized: storage_path={}", storage_path)
+
+    def create_storage(self, table_name: str) -> "SqliteStorage":
+        """Return configured storage for the agent.
 
-    def create_storage(self, table_name: str) -> SqliteStorage:
-        """Create and return configured storage for the agent.
+        Storages are shared process-wide per database file and table, so
+        agents created for the same path reuse one instance and its writer.
 
         Args:
             table_name: Name of the database table to use
 
         Returns:
             Configured SqliteStorage instance
+
+        Raises:
+            ValueError: If no storage path is configured
         """
-        # Create storage directory if needed
-        if self.storage_path:
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.storage_path is None:
+            raise ValueError("storage_path is required to create agent storage")
+
+        from .._storage import get_shared_storage
 
-        storage = SqliteStorage(
-            table_name=table_name,
-            db_file=str(self.storage_path),
-        )
+        storage = get_shared_storage(self.storage_path.resolve(), table_name)
+        if storage not in self._storages:
+            self._storages.append(storage)
 
-        logger.debug(f"Created agent storage at {self.storage_path} with table {table_name}")
+        # Called for every agent created; brace-style arguments are only formatted when debug logging is enabled
+        logger.debug("Using agent storage at {} with table {}", self.storage_path, table_name)
         return storage
+
+    def flush_storage(self) -> None:
+        """Write buffered sessions of all storages created by this factory."""
+        for storage in self._storages:
+            storage.flush()
@@ -5,10 +5,15 @@ Provides common functionality for workspace directory setup and file operations.
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from agno.tools.file import FileTools
 from loguru import logger
 
+from .._shared import get_file_tools
+
+if TYPE_CHECKING:
+    from agno.tools.file import FileTools
+
 
 class WorkspaceMixin:
     """Mixin for workspace and file operations management."""
@@ -23,13 +28,13 @@ class WorkspaceMixin:
         """
         super().__init__(*args, **kwargs)
         self.workspace_dir = workspace_dir or Path("./workspace")
-        logger.debug(f"WorkspaceMixin initialized: workspace_dir={self.workspace_dir}")
+        logger.debug("WorkspaceMixin initialized: workspace_dir={}", self.workspace_dir)
 
-    def create_file_tools(self) -> FileTools:
-        """Create and return configured FileTools for workspace operations.
+    def create_file_tools(self) -> "FileTools":
+        """Return FileTools for workspace operations, shared per workspace directory.
 
         Returns:
             Configured FileTools instance
         """
-        logger.debug(f"Creating FileTools with base_dir={self.workspace_dir}")
-        return FileTools(base_dir=self.workspace_dir)
+        logger.debug("Using FileTools with base_dir={}", self.workspace_dir)
+        return get_file_tools(str(self.workspace_dir))
@@ -5,7 +5,6 @@ This module implements an AI agent using the Agno framework that can search
 through the RHDH documentation knowledge base and provide intelligent responses.
 """
 
-import uuid
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -15,6 +14,7 @@ from agno.models.google import Gemini
 from agno.tools.reasoning import ReasoningTools
 from loguru import logger
 
+from ._shared import new_session_id
 from .base import BaseAgentFactory
 from .mixins import KnowledgeMixin, StorageMixin, WorkspaceMixin
 
@@ -57,7 +57,7 @@ class SearchAgent(KnowledgeMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
@@ -5,7 +5,6 @@ This module implements an AI agent that analyzes test failures from Playwright t
 using the Agno framework with pre-downloaded artifacts and AI-powered analysis.
 """
 
-import uuid
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +14,8 @@ from agno.models.google import Gemini
 from agno.storage.sqlite import SqliteStorage
 from loguru import logger
 
-from ..utils.test_analysis import TestArtifactDownloader, extract_failed_testsuites
+from ..utils.test_analysis import TestArtifactDownloader, extract_failed_testsuites_batch
+from ._shared import new_session_id
 
 
 class TestAnalysisAgent:
@@ -52,7 +52,7 @@ class TestAnalysisAgent:
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
@@ -234,12 +234,14 @@ You are analyzing test failures with the following pre-downloaded artifacts:
         # Add JUnit XML content
         if artifacts["junit_files"]:
             prompt_parts.append("\n## JUnit XML Test Results\n")
-            for junit_name, junit_path in artifacts["junit_files"].items():
-                try:
-                    failed_testsuites = extract_failed_testsuites(junit_path)
+            junit_files = artifacts["junit_files"]
+            try:
+                extracted = extract_failed_testsuites_batch(list(junit_files.values()))
+            except Exception as e:
+                prompt_parts.append(f"Error reading JUnit XML: {e}\n")
+            else:
+                for junit_name, failed_testsuites in zip(junit_files, extracted, strict=True):
                     prompt_parts.append(f"### {junit_name}\n```xml\n{failed_testsuites}\n```\n")
-                except Exception as e:
-                    prompt_parts.append(f"### {junit_name}\nError reading JUnit XML: {e}\n")
 
         # Add build logs
         if artifacts["build_logs"]:
@@ -80,15 +80,10 @@ async def run_agent_chat(
     for info in agent_factory.get_extra_info():
         console.print(info)
 
-    # Use the standard initialization pattern for all agents
-    agent = await agent_factory.initialize_agent()
-
-    try:
-        # Run the interactive chat loop
+    # Use the standard initialization pattern for all agents; the session
+    # cleans up its resources (e.g. MCP servers) however the loop exits
+    async with agent_factory.session() as agent:
         await agent.acli_app(message=message, stream=streaming_enabled, user_id=user_id)
-    finally:
-        # Cleanup any resources
-        await agent_factory.cleanup()
 
 
 @chat_app.command()
@@ -11,7 +11,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from sidekick.tools.jira import _get_jira_client
 from sidekick.utils.jira_client_utils import DEFAULT_NUM_ISSUES, fetch_and_transform_issues, get_jira_triager_fields
 
 from ..agents.jira_knowledge import JiraKnowledgeManager
@@ -143,8 +142,8 @@ def triage(
             console.print(Panel(panel_text, title="Recommended Assignment", title_align="left", border_style="magenta"))
 
     else:
-        jira_knowledge_manager = JiraKnowledgeManager()
-        agent = JiraTriagerAgent(jira_knowledge_manager=jira_knowledge_manager)
+        # The Jira toolkit module loads agno; only the batch path needs its client
+        from sidekick.tools.jira import _get_jira_client
 
         jira = _get_jira_client()
         issues = jira.search_issues(JIRA_FILTER, maxResults=100)
@@ -154,22 +153,32 @@ def triage(
         table.add_column("Component Assignment", style="green")
         table.add_column("Confidence", style="yellow", justify="center")
 
+        tickets = []
         for issue in issues:
             try:
                 fetched = get_jira_triager_fields(issue)
             except Exception as e:
                 typer.echo(f"Error fetching Jira issue: {e}")
                 raise typer.Exit(1) from e
-            current_ticket = {
-                "key": issue.key,
-                "title": fetched.get("title", ""),
-                "description": fetched.get("description", ""),
-                "component": fetched.get("components", ""),
-                "team": fetched.get("team", ""),
-                "assignee": fetched.get("assignee", ""),
-                "project_key": fetched.get("project_key", ""),
-            }
-            result = agent.triage_ticket(current_ticket)
+            tickets.append(
+                {
+                    "key": issue.key,
+                    "title": fetched.get("title", ""),
+                    "description": fetched.get("description", ""),
+                    "component": (fetched.get("components") or [""])[0],
+                    "team": fetched.get("team", ""),
+                    "assignee": fetched.get("assignee", ""),
+                    "project_key": fetched.get("project_key", ""),
+                }
+            )
+
+        # Triage all tickets concurrently; failures are reported per ticket
+        results = agent.triage_tickets(tickets)
+
+        for current_ticket, result in zip(tickets, results, strict=True):
+            if isinstance(result, BaseException):
+                table.add_row(current_ticket["key"], f"[red]Error: {result}[/red]", "", "")
+                continue
 
             # Determine what to display for each field
             team_display = (
@@ -196,7 +205,7 @@ def triage(
             else:
                 confidence_display = ""  # Empty fields, no recommendations
 
-            table.add_row(issue.key, team_display, component_display, confidence_display)
+            table.add_row(current_ticket["key"], team_display, component_display, confidence_display)
 
         console.print()
         console.print(table)
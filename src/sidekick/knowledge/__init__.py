@@ -1,5 +1,18 @@
 """Knowledge management module."""
 
-from .manager import KnowledgeManager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager import KnowledgeManager
 
 __all__ = ["KnowledgeManager"]
+
+
+def __getattr__(name: str) -> Any:
+    # The manager pulls in LanceDB, the embedders and the document readers;
+    # defer it so the source/manifest modules can be imported on their own.
+    if name in __all__:
+        from . import manager
+
+        return getattr(manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -75,6 +75,18 @@ class PromptRegistry:
 
         return self._templates[name]
 
+    def __contains__(self, name: object) -> bool:
+        """
+        Check whether a template is registered (loaded or file-backed).
+
+        Args:
+            name: Name of the template
+
+        Returns:
+            True if ``get(name)`` would find the template
+        """
+        return name in self._templates or name in self._template_paths
+
     def list_templates(self) -> list[str]:
         """
         List all registered template names.
@@ -5,7 +5,6 @@ This module implements a coordinate mode team that combines Jira ticket manageme
 GitHub repository operations, and knowledge base searches using specialized agents.
 """
 
-import uuid
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +16,7 @@ from agno.tools.file import FileTools
 from agno.tools.mcp import MCPTools
 from loguru import logger
 
+from ..agents._shared import get_file_tools, new_session_id
 from ..agents.github_agent import GitHubAgent
 from ..agents.jira_agent import JiraAgent
 from ..agents.search_agent import SearchAgent
@@ -73,7 +73,7 @@ class TagTeam:
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
@@ -168,7 +168,7 @@ class TagTeam:
         self._gdrive_tools = GoogleDriveTools(workspace_dir=self.workspace_dir)
 
         # Create File tools for team coordinator
-        self._file_tools = FileTools(base_dir=self.workspace_dir)
+        self._file_tools = get_file_tools(str(self.workspace_dir))
 
         # Start MCP context
         if self._jira_mcp_tools is not None:
@@ -5,7 +5,6 @@ This module implements a coordinate mode team that analyzes test failures using
 specialized agents for different types of artifacts.
 """
 
-import uuid
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +16,7 @@ from agno.team import Team, TeamRunResponse
 from agno.tools.file import FileTools
 from loguru import logger
 
+from ..agents._shared import new_session_id
 from ..utils.test_analysis import TestArtifactDownloader, extract_failed_testsuites
 
 
@@ -57,7 +57,7 @@ class TestAnalysisTeam:
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
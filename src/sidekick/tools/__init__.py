@@ -4,10 +4,30 @@ Sidekick Tools Package.
 This package contains custom tools for use with AI agents in the sidekick CLI application.
 """
 
-from .gdrive_toolkit import GoogleDriveTools
-from .jira import JiraTools
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .gdrive_toolkit import GoogleDriveTools
+    from .github_graphql import GitHubGraphQLTools
+    from .jira import JiraTools
 
 __all__ = [
+    "GitHubGraphQLTools",
     "GoogleDriveTools",
     "JiraTools",
 ]
+
+_EXPORTS = {
+    "GitHubGraphQLTools": ".github_graphql",
+    "GoogleDriveTools": ".gdrive_toolkit",
+    "JiraTools": ".jira",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Load each toolkit on first use, so importing e.g. ``sidekick.tools.jira``
+    # does not also load agno and the Google Drive client.
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,201 @@
+"""
+GitHub GraphQL toolkit for fetching nested repository data in a single request.
+
+The REST-based GithubTools need one request each for a pull request, its
+comments and its changed files. The GraphQL API returns all of them in one
+round-trip, which keeps agents well below the GitHub rate limit.
+"""
+
+import json
+import re
+from typing import Any
+
+import requests
+from agno.tools import Toolkit
+from loguru import logger
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Top-level definitions graphql_query accepts; mutations and subscriptions are rejected
+READ_ONLY_DEFINITIONS = frozenset({"query", "fragment"})
+
+# Block strings, strings and comments are skipped; braces, parentheses and names are kept
+_GRAPHQL_TOKEN = re.compile(r'"""(?:\\"""|[^"]|"(?!""))*"""|"(?:\\.|[^"\\\n])*"|#[^\n]*|[{}()]|[_A-Za-z][_0-9A-Za-z]*')
+
+
+PULL_REQUEST_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      state
+      url
+      author { login }
+      createdAt
+      mergedAt
+      baseRefName
+      headRefName
+      additions
+      deletions
+      labels(first: 20) { nodes { name } }
+      files(first: 100) { nodes { path additions deletions changeType } }
+      reviews(first: 50) { nodes { author { login } state body submittedAt } }
+      comments(first: 100) { nodes { author { login } body createdAt } }
+    }
+  }
+}
+"""
+
+ISSUE_TIMELINE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $number) {
+      number
+      title
+      body
+      state
+      url
+      author { login }
+      createdAt
+      closedAt
+      labels(first: 20) { nodes { name } }
+      comments(first: 100) { nodes { author { login } body createdAt } }
+      timelineItems(first: 100) {
+        nodes {
+          __typename
+          ... on CrossReferencedEvent { createdAt source { ... on PullRequest { number url title state } } }
+          ... on LabeledEvent { createdAt label { name } }
+          ... on ClosedEvent { createdAt }
+          ... on ReopenedEvent { createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _definition_types(document: str) -> list[str]:
+    """Return the kind of each top-level definition in a GraphQL document.
+
+    Anonymous ``{ ... }`` operations are reported as ``query``. This is a lexical
+    scan, not a full parse; invalid documents are left for GitHub to reject.
+    """
+    kinds: list[str] = []
+    depth = 0
+    expect_definition = True
+    for match in _GRAPHQL_TOKEN.finditer(document):
+        token = match.group()
+        if token[0] in '"#':
+            continue
+        if depth == 0 and expect_definition:
+            kinds.append("query" if token == "{" else token)
+            expect_definition = False
+        if token in ("{", "("):
+            depth += 1
+        elif token in ("}", ")"):
+            depth -= 1
+            if depth == 0 and token == "}":
+                expect_definition = True
+    return kinds
+
+
+class GitHubGraphQLTools(Toolkit):
+    """Toolkit for querying the GitHub GraphQL API."""
+
+    def __init__(
+        self,
+        access_token: str,
+        graphql_query: bool = True,
+        get_pull_request_overview: bool = True,
+        get_issue_with_timeline: bool = True,
+        **kwargs,
+    ):
+        """Initialize GitHub GraphQL toolkit.
+
+        Args:
+            access_token: GitHub access token
+            graphql_query: Include the raw graphql_query tool (default: True)
+            get_pull_request_overview: Include get_pull_request_overview tool (default: True)
+            get_issue_with_timeline: Include get_issue_with_timeline tool (default: True)
+            **kwargs: Additional arguments passed to parent Toolkit
+        """
+        self._session = requests.Session()
+        self._session.headers.update({"Authorization": f"Bearer {access_token}"})
+
+        tools: list[Any] = []
+        if graphql_query:
+            tools.append(self.graphql_query)
+        if get_pull_request_overview:
+            tools.append(self.get_pull_request_overview)
+        if get_issue_with_timeline:
+            tools.append(self.get_issue_with_timeline)
+
+        super().__init__(name="github_graphql_tools", tools=tools, **kwargs)
+
+    def _execute(self, query: str, variables: dict[str, Any]) -> str:
+        """Run a GraphQL query and return the response as a JSON string."""
+        try:
+            response = self._session.post(GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables}, timeout=30)
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("errors"):
+                logger.warning(f"GitHub GraphQL returned errors: {payload['errors']}")
+            return json.dumps(payload, indent=2)
+        except Exception as e:
+            logger.error(f"Error executing GitHub GraphQL query: {e}")
+            return json.dumps({"error": str(e)})
+
+    def graphql_query(self, query: str, variables: str = "{}") -> str:
+        """Run a read-only query against the GitHub GraphQL API.
+
+        Mutations and subscriptions are rejected without contacting GitHub.
+
+        Args:
+            query: GraphQL query document
+            variables: JSON object with the query variables (default: "{}")
+
+        Returns:
+            JSON string with the GraphQL response
+        """
+        kinds = _definition_types(query)
+        if not kinds or not READ_ONLY_DEFINITIONS.issuperset(kinds):
+            rejected = sorted(set(kinds) - READ_ONLY_DEFINITIONS) or ["empty document"]
+            logger.warning(f"Rejected GitHub GraphQL document with {', '.join(rejected)}")
+            return json.dumps({"error": f"Only query operations are allowed, got: {', '.join(rejected)}"})
+
+        try:
+            parsed_variables = json.loads(variables) if variables else {}
+        except json.JSONDecodeError as e:
+            return json.dumps({"error": f"Invalid variables JSON: {e}"})
+        return self._execute(query, parsed_variables)
+
+    def get_pull_request_overview(self, owner: str, repo: str, number: int) -> str:
+        """Get a pull request with its files, reviews and comments in one request.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            number: Pull request number
+
+        Returns:
+            JSON string with the pull request details
+        """
+        logger.debug(f"Fetching pull request overview for {owner}/{repo}#{number}")
+        return self._execute(PULL_REQUEST_QUERY, {"owner": owner, "repo": repo, "number": number})
+
+    def get_issue_with_timeline(self, owner: str, repo: str, number: int) -> str:
+        """Get an issue with its comments and timeline events in one request.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            number: Issue number
+
+        Returns:
+            JSON string with the issue details
+        """
+        logger.debug(f"Fetching issue timeline for {owner}/{repo}#{number}")
+        return self._execute(ISSUE_TIMELINE_QUERY, {"owner": owner, "repo": repo, "number": number})
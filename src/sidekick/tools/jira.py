@@ -5,6 +5,9 @@ Jira toolkit for interacting with Jira issues and projects.
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 from agno.tools import Toolkit
@@ -16,6 +19,46 @@ try:
 except ImportError:
     raise ImportError("`jira` not installed. Please install using `pip install jira`") from None
 
+# GitHub pull request URLs, e.g. https://github.com/owner/repo/pull/123
+GITHUB_PR_URL_RE = re.compile(r"https://github\.com/[^/\s]+/[^/\s]+/pull/\d+", re.IGNORECASE)
+
+# Workflows often read the same issue several times within seconds (e.g. PR
+# link extraction, then analysis); fetched issues are reused for this long
+ISSUE_CACHE_TTL = 60
+
+# Most issues kept in the cache; the least recently used are dropped first
+ISSUE_CACHE_SIZE = 256
+
+# Issue JSON keyed by (server URL, issue key, include_all_comments), with its fetch time
+_issue_cache: OrderedDict[tuple[str, str, bool], tuple[float, str]] = OrderedDict()
+_issue_cache_lock = threading.Lock()
+
+
+def clear_issue_cache(issue_key: str | None = None) -> None:
+    """Drop cached issues fetched by JiraTools.get_issue().
+
+    Args:
+        issue_key: Only drop this issue, on any server (default: drop all issues)
+    """
+    with _issue_cache_lock:
+        if issue_key is None:
+            _issue_cache.clear()
+            return
+        for key in [key for key in _issue_cache if key[1] == issue_key]:
+            del _issue_cache[key]
+
+
+def extract_github_pr_urls(texts: list[str]) -> list[list[str]]:
+    """Extract GitHub PR URLs from many texts, e.g. the descriptions of a batch of issues.
+
+    Args:
+        texts: Texts to search for GitHub PR URLs
+
+    Returns:
+        For each text, the unique PR URLs it contains in order of appearance
+    """
+    return [list(dict.fromkeys(GITHUB_PR_URL_RE.findall(text))) if text else [] for text in texts]
+
 
 class JiraCommentData(BaseModel):
     """Pydantic model for Jira comment data."""
@@ -56,8 +99,6 @@ def parse_json_to_jira_issue(json_content: str) -> JiraIssueData | None:
     Returns:
         JiraIssueData object if parsing successful, None otherwise
     """
-    import json
-
     try:
         data = json.loads(json_content)
 
@@ -141,6 +182,7 @@ class JiraTools(Toolkit):
         search_issues: bool = True,
         add_comment: bool = False,
         create_issue: bool = False,
+        issue_cache_ttl: float = ISSUE_CACHE_TTL,
         **kwargs,
     ):
         """Initialize Jira toolkit.
@@ -150,10 +192,13 @@ class JiraTools(Toolkit):
             search_issues: Include search_issues tool (default: True)
             add_comment: Include add_comment tool (default: False)
             create_issue: Include create_issue tool (default: False)
+            issue_cache_ttl: Seconds a fetched issue is reused by get_issue (0 disables caching)
             **kwargs: Additional arguments passed to parent Toolkit
         """
         # Initialize JIRA client once
         self._jira_client = None
+        self._server_url: str | None = None
+        self.issue_cache_ttl = issue_cache_ttl
 
         tools: list[Any] = []
         if get_issue:
@@ -198,6 +243,7 @@ class JiraTools(Toolkit):
             except Exception as e:
                 logger.error(f"Failed to create JIRA client: {e}")
                 raise
+            self._server_url = server_url
 
         return self._jira_client
 
@@ -210,14 +256,7 @@ class JiraTools(Toolkit):
         Returns:
             List of GitHub PR URLs found in the text
         """
-        if not text:
-            return []
-
-        # Pattern to match GitHub PR URLs
-        pattern = r"https://github\.com/[^/\s]+/[^/\s]+/pull/\d+"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-
-        return list(set(matches))  # Remove duplicates
+        return extract_github_pr_urls([text])[0]
 
     def _format_issue_details(self, issue: Issue) -> JiraIssueData:
         """
@@ -351,7 +390,7 @@ class JiraTools(Toolkit):
             updated_date=details["updated_date"],
             components=details["components"],
             labels=details["labels"],
-            pull_requests=list(set(pr_urls)),  # Remove duplicates
+            pull_requests=list(dict.fromkeys(pr_urls)),  # Remove duplicates, keeping order
             comments=comments_data if comments_data else None,
             custom_fields=custom_fields if custom_fields else None,
         )
@@ -371,6 +410,21 @@ class JiraTools(Toolkit):
         Returns:
             JSON string containing detailed issue information including GitHub PR links and all comments
         """
+        # Issue keys are only unique per server; before the client exists, it will connect to JIRA_URL
+        cache_key = (self._server_url or os.getenv("JIRA_URL") or "", issue_key, include_all_comments)
+        if self.issue_cache_ttl > 0:
+            with _issue_cache_lock:
+                cached = _issue_cache.get(cache_key)
+                if cached is not None:
+                    if time.monotonic() - cached[0] < self.issue_cache_ttl:
+                        _issue_cache.move_to_end(cache_key)
+                    else:
+                        del _issue_cache[cache_key]
+                        cached = None
+            if cached is not None:
+                logger.debug(f"Using cached issue {issue_key}")
+                return cached[1]
+
         try:
             logger.debug(f"Starting to retrieve issue {issue_key}")
             jira = self._get_jira_client()
@@ -402,7 +456,14 @@ class JiraTools(Toolkit):
             logger.debug(f"Found {len(issue_details.pull_requests)} PR URLs")
             logger.debug(f"Total comments processed: {len(issue_details.comments or [])}")
 
-            return json.dumps(issue_details.model_dump(), indent=2)
+            result = json.dumps(issue_details.model_dump(), indent=2)
+            if self.issue_cache_ttl > 0:
+                with _issue_cache_lock:
+                    _issue_cache[cache_key] = (time.monotonic(), result)
+                    _issue_cache.move_to_end(cache_key)
+                    while len(_issue_cache) > ISSUE_CACHE_SIZE:
+                        _issue_cache.popitem(last=False)
+            return result
 
         except Exception as e:
             error_msg = f"Error retrieving issue {issue_key}: {str(e)}"
@@ -509,6 +570,8 @@ class JiraTools(Toolkit):
 
             jira = self._get_jira_client()
             result = jira.add_comment(issue_key, comment)
+            # The cached copy no longer lists all comments
+            clear_issue_cache(issue_key)
 
             logger.info(f"Comment added to issue {issue_key}")
             logger.debug(f"Comment result: {result}")
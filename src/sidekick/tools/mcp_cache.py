@@ -0,0 +1,120 @@
+"""
+MCP toolkit that remembers the server's tool schemas on disk.
+
+Listing tools is a round-trip to the MCP server on every start. The schemas
+of the included tools rarely change, so they are cached in a JSON file and
+reused until the cache expires or the server configuration changes.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from agno.tools.function import Function
+from agno.tools.mcp import MCPTools
+from agno.utils.mcp import get_entrypoint_for_tool
+from loguru import logger
+from mcp.types import Tool as MCPTool
+
+# Bump when the cached entry format changes
+TOOL_CACHE_SCHEMA_VERSION = 1
+
+DEFAULT_TOOL_CACHE_PATH = Path("tmp/mcp_tool_cache.json")
+
+
+def tool_cache_key(command: str, env: dict[str, str], include_tools: list[str] | None) -> str:
+    """Build the cache key for a server configuration.
+
+    The configuration is hashed so credentials in ``env`` are not written to disk.
+    """
+    config = json.dumps(
+        {"cmd": command, "env": env, "tools": include_tools, "version": TOOL_CACHE_SCHEMA_VERSION},
+        sort_keys=True,
+    )
+    return hashlib.sha1(config.encode()).hexdigest()
+
+
+def _load_cached_tools(path: Path, key: str, ttl_seconds: float) -> list[dict[str, Any]] | None:
+    """Return cached tool schemas for a key, or None if missing, empty or expired."""
+    try:
+        entry = json.loads(path.read_text()).get(key)
+    except (OSError, ValueError):
+        return None
+    if not entry or time.time() - entry.get("saved_at", 0) > ttl_seconds:
+        return None
+    # An empty list can only come from a failed listing; never reuse it
+    return entry.get("tools") or None
+
+
+def _save_tool_cache(path: Path, key: str, tools: list[dict[str, Any]]) -> None:
+    """Store tool schemas for a key, keeping entries for other configurations."""
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    cache[key] = {"saved_at": time.time(), "tools": tools}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.warning(f"Could not write MCP tool cache {path}: {e}")
+
+
+class CachedMCPTools(MCPTools):
+    """MCPTools that registers tools from an on-disk schema cache when possible."""
+
+    def __init__(
+        self,
+        *args,
+        cache_key: str,
+        cache_path: Path = DEFAULT_TOOL_CACHE_PATH,
+        cache_ttl_seconds: float = 3600,
+        **kwargs,
+    ):
+        """Initialize the toolkit.
+
+        Args:
+            cache_key: Key identifying the server configuration (see tool_cache_key)
+            cache_path: JSON file holding cached tool schemas
+            cache_ttl_seconds: How long cached schemas are trusted
+            *args: Passed to MCPTools
+            **kwargs: Passed to MCPTools
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.cache_path = cache_path
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+    async def initialize(self) -> None:
+        """Register tools from the cache, falling back to listing them on the server."""
+        if self._initialized:
+            return
+
+        cached_tools = _load_cached_tools(self.cache_path, self.cache_key, self.cache_ttl_seconds)
+        if cached_tools is None or self.session is None:
+            await super().initialize()
+            # Do not cache the outcome of a listing that failed or returned nothing
+            if not self._initialized or not self.functions:
+                return
+            tools = [
+                {"name": f.name, "description": f.description, "inputSchema": f.parameters}
+                for f in self.functions.values()
+            ]
+            _save_tool_cache(self.cache_path, self.cache_key, tools)
+            return
+
+        # The protocol handshake is still required; only list_tools is skipped
+        await self.session.initialize()
+        for spec in cached_tools:
+            tool = MCPTool.model_validate(spec)
+            self.functions[tool.name] = Function(
+                name=tool.name,
+                description=tool.description,
+                parameters=tool.inputSchema,
+                entrypoint=get_entrypoint_for_tool(tool, self.session),
+                skip_entrypoint_processing=True,
+            )
+        logger.debug(f"{self.name} initialized with {len(cached_tools)} cached tools")
+        self._initialized = True
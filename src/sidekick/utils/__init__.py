@@ -5,6 +5,19 @@ This package contains utility functions and classes that support
 the main application functionality.
 """
 
-from .gdrive import GoogleDriveExporter, GoogleDriveExporterConfig
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .gdrive import GoogleDriveExporter, GoogleDriveExporterConfig
 
 __all__ = ["GoogleDriveExporter", "GoogleDriveExporterConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer the Google Drive/auth client imports until they are actually used,
+    # so importing e.g. ``sidekick.utils.storage`` stays cheap.
+    if name in __all__:
+        from . import gdrive
+
+        return getattr(gdrive, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,36 @@
+"""
+XML parsing backend selection.
+
+Uses lxml when it is installed (libxml2 parses large JUnit reports several
+times faster than the pure ElementTree path) and falls back to the standard
+library otherwise. Both backends expose the ElementTree API used here.
+"""
+
+try:
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on the environment
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+
+    HAS_LXML = False
+
+
+def fromstring(text: str | bytes):
+    """Parse an XML document from a string or bytes.
+
+    lxml refuses ``str`` input that carries an encoding declaration, which
+    JUnit reports usually do, so text is encoded before parsing.
+
+    Args:
+        text: XML document content
+
+    Returns:
+        Root element of the parsed document
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    return ET.fromstring(text)
+
+
+__all__ = ["ET", "HAS_LXML", "fromstring"]
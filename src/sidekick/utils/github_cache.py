@@ -0,0 +1,137 @@
+"""
+Conditional-request caching for the GitHub REST API.
+
+GitHub answers a GET carrying ``If-None-Match`` with ``304 Not Modified`` when
+the resource is unchanged, and 304 responses do not count against the rate
+limit. This module persists ETags and response bodies in a small SQLite
+database and hooks PyGithub's requester so every GET becomes conditional.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class GitHubETagCache:
+    """SQLite-backed store of ETags and response bodies keyed by request."""
+
+    def __init__(self, db_path: Path):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT NOT NULL, headers TEXT, body TEXT)"
+        )
+        self._conn.commit()
+        logger.debug(f"GitHub ETag cache opened at {db_path}")
+
+    @staticmethod
+    def make_key(url: str, parameters: dict[str, Any] | None, authorization: str = "") -> str:
+        """Build the cache key for a request URL, its query parameters and its credentials.
+
+        The Authorization header is only stored as a fingerprint, so tokens never
+        reach the database and responses are never shared between tokens.
+        """
+        fingerprint = hashlib.sha256(authorization.encode()).hexdigest()[:16]
+        return f"{fingerprint}:{url}?{json.dumps(parameters or {}, sort_keys=True)}"
+
+    def get(self, key: str) -> tuple[str, dict[str, Any], str] | None:
+        """Return (etag, headers, body) for a key, or None if not cached."""
+        with self._lock:
+            row = self._conn.execute("SELECT etag, headers, body FROM etags WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        etag, headers, body = row
+        return etag, json.loads(headers or "{}"), body
+
+    def put(self, key: str, etag: str, headers: dict[str, Any], body: str) -> None:
+        """Store the ETag, headers and body of a successful response."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO etags (key, etag, headers, body) VALUES (?, ?, ?, ?)",
+                (key, etag, json.dumps(headers), body),
+            )
+            self._conn.commit()
+
+
+_cache: GitHubETagCache | None = None
+_install_lock = threading.Lock()
+
+
+def _authorization(requester: Any, headers: dict[str, Any] | None) -> str | None:
+    """Return the Authorization header a request is sent with, or None if it cannot be determined."""
+    if headers and "Authorization" in headers:
+        return str(headers["Authorization"])
+    auth = getattr(requester, "auth", None)
+    if auth is None:
+        return ""
+    try:
+        return f"{auth.token_type} {auth.token}"
+    except Exception:
+        return None
+
+
+def _conditional_request_json(original_request_json: Callable[..., Any], cache: GitHubETagCache) -> Callable[..., Any]:
+    """Wrap Requester.requestJson so GETs carry the cached ETag and 304s return the cached body."""
+
+    def request_json(self, verb, url, parameters=None, headers=None, input=None, *args, **kwargs):
+        authorization = _authorization(self, headers) if verb == "GET" and input is None else None
+        if authorization is None:
+            return original_request_json(self, verb, url, parameters, headers, input, *args, **kwargs)
+
+        key = GitHubETagCache.make_key(url, parameters, authorization)
+        cached = cache.get(key)
+        if cached is not None:
+            headers = {**(headers or {}), "If-None-Match": cached[0]}
+
+        status, response_headers, output = original_request_json(
+            self, verb, url, parameters, headers, input, *args, **kwargs
+        )
+
+        if status == 304 and cached is not None:
+            logger.debug(f"GitHub cache hit (304): {url}")
+            return 200, {**cached[1], **response_headers}, cached[2]
+        if status == 200 and response_headers.get("etag"):
+            cache.put(key, response_headers["etag"], response_headers, output)
+        return status, response_headers, output
+
+    return request_json
+
+
+def install_github_etag_cache(db_path: Path) -> GitHubETagCache:
+    """Make PyGithub GET requests conditional, backed by an on-disk cache.
+
+    Installing is idempotent; the first database path wins for the process.
+
+    Args:
+        db_path: Path of the SQLite database file
+
+    Returns:
+        The active cache
+    """
+    global _cache
+
+    with _install_lock:
+        if _cache is not None:
+            return _cache
+
+        from github.Requester import Requester
+
+        cache = GitHubETagCache(db_path)
+        Requester.requestJson = _conditional_request_json(Requester.requestJson, cache)
+        _cache = cache
+        logger.debug("Installed GitHub ETag cache")
+        return cache
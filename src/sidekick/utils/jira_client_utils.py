@@ -2,28 +2,75 @@
 Jira client utility functions for the sidekick CLI application.
 """
 
-from loguru import logger
+import threading
+import time
+from functools import lru_cache
 
-from sidekick.tools.jira import _get_jira_client
+from loguru import logger
 
 DEFAULT_NUM_ISSUES = 50
 
+# Project components rarely change; fetched names are reused for this many seconds
+COMPONENT_NAMES_TTL = 600
+
+_component_names_cache: dict[str, tuple[float, tuple[str, ...], frozenset[str]]] = {}
+# One lock per project, so a slow fetch for one project does not block lookups for others
+_component_names_locks: dict[str, threading.Lock] = {}
+_component_names_locks_lock = threading.Lock()
+
+
+def _project_components(project_key: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Return a project's component names, in Jira's order and as a set, fetching them if needed."""
+    with _component_names_locks_lock:
+        project_lock = _component_names_locks.setdefault(project_key, threading.Lock())
+    # Held across the fetch so concurrent callers for the same project wait for one request
+    with project_lock:
+        cached = _component_names_cache.get(project_key)
+        if cached is not None and time.monotonic() - cached[0] < COMPONENT_NAMES_TTL:
+            return cached[1], cached[2]
+
+        # The Jira toolkit module loads agno; import it only when a client is needed
+        from sidekick.tools.jira import _get_jira_client
+
+        jira = _get_jira_client()
+        try:
+            components = jira.project_components(project_key)
+            names = tuple(comp.name for comp in components)
+        except Exception as e:
+            logger.error(f"Failed to fetch components for project {project_key}: {e}")
+            return (), frozenset()
+        name_set = frozenset(names)
+        _component_names_cache[project_key] = (time.monotonic(), names, name_set)
+        return names, name_set
+
 
 def get_project_component_names(project_key: str) -> list[str]:
     """
     Return the list of component names for the given Jira project key.
+
+    Names are cached per project for COMPONENT_NAMES_TTL seconds, so triaging
+    many tickets of one project queries Jira once. Failed lookups are not cached.
+
     Args:
         project_key: The Jira project key (e.g., 'RHIDP')
     Returns:
         List of component names (str)
     """
-    jira = _get_jira_client()
-    try:
-        components = jira.project_components(project_key)
-        return [comp.name for comp in components]
-    except Exception as e:
-        logger.error(f"Failed to fetch components for project {project_key}: {e}")
-        return []
+    return list(_project_components(project_key)[0])
+
+
+def get_project_component_set(project_key: str) -> frozenset[str]:
+    """
+    Return the component names of the given Jira project key as a set, for membership checks.
+
+    Shares the cache of get_project_component_names().
+
+    Args:
+        project_key: The Jira project key (e.g., 'RHIDP')
+    Returns:
+        Set of component names (str)
+    """
+    return _project_components(project_key)[1]
 
 
 def get_jira_triager_fields(issue_id: str) -> dict:
@@ -36,6 +83,8 @@ def get_jira_triager_fields(issue_id: str) -> dict:
     Returns:
         dict with keys: title, description, components, team (if available), assignee
     """
+    from sidekick.tools.jira import _get_jira_client
+
     jira = _get_jira_client()
     try:
         issue = jira.issue(issue_id, expand="renderedFields,changelog,comments")
@@ -64,6 +113,9 @@ def get_jira_triager_fields(issue_id: str) -> dict:
     }
 
 
+# Each ticket's description is cleaned for both the semantic cache lookup and
+# the prompt, and again whenever the same ticket is triaged later in a batch
+@lru_cache(maxsize=1024)
 def clean_jira_description(text):
     if not text:
         return ""
@@ -86,6 +138,8 @@ def fetch_and_transform_issues(
     """
     import json
 
+    from sidekick.tools.jira import _get_jira_client
+
     jira = _get_jira_client()
     start_at = 0
     transformed_data: list[dict[str, str]] = []
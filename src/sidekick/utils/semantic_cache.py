@@ -0,0 +1,100 @@
+"""
+Semantic cache for LLM answers to near-duplicate questions.
+
+Support tickets are often filed from the same template or describe the same
+recurring problem. Answers are stored with an embedding of the question, and
+a new question whose embedding is close enough to a stored one reuses its
+answer instead of asking the model again.
+"""
+
+import json
+import math
+import sqlite3
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+def _normalize(vector: Sequence[float]) -> tuple[float, ...]:
+    """Scale a vector to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return tuple(x / norm for x in vector)
+
+
+class SemanticCache:
+    """SQLite-backed store of answers keyed by question embedding.
+
+    Entries are grouped by a ``scope`` string; only entries of the same scope
+    are compared, so answers are never reused across different kinds of
+    question (e.g. triages asking for different missing fields).
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+    ):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+            embed: Function returning the embedding of a text
+            threshold: Minimum cosine similarity for a stored answer to be reused
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.embed = embed
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers "
+            "(id INTEGER PRIMARY KEY, scope TEXT NOT NULL, embedding TEXT NOT NULL, answer TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        # Normalized embeddings are kept in memory for the similarity scan
+        self._entries: dict[str, list[tuple[tuple[float, ...], Any]]] = {}
+        for scope, embedding, answer in self._conn.execute("SELECT scope, embedding, answer FROM answers"):
+            self._entries.setdefault(scope, []).append((tuple(json.loads(embedding)), json.loads(answer)))
+        logger.debug(f"Semantic cache opened at {db_path} with {sum(map(len, self._entries.values()))} entries")
+
+    def embed_text(self, text: str) -> tuple[float, ...]:
+        """Return the normalized embedding of a text."""
+        return _normalize(self.embed(text))
+
+    def get(self, scope: str, embedding: tuple[float, ...]) -> Any | None:
+        """Return the stored answer most similar to an embedding, if similar enough.
+
+        Args:
+            scope: Group of entries to compare against
+            embedding: Normalized embedding from embed_text()
+
+        Returns:
+            The stored answer, or None on a miss
+        """
+        with self._lock:
+            entries = list(self._entries.get(scope, ()))
+        best_score, best_answer = -1.0, None
+        for stored, answer in entries:
+            score = sum(a * b for a, b in zip(stored, embedding, strict=False))
+            if score > best_score:
+                best_score, best_answer = score, answer
+        if best_score >= self.threshold:
+            logger.debug(f"Semantic cache hit (similarity {best_score:.3f})")
+            return best_answer
+        return None
+
+    def put(self, scope: str, embedding: tuple[float, ...], answer: Any) -> None:
+        """Store a JSON-serializable answer for an embedding."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO answers (scope, embedding, answer) VALUES (?, ?, ?)",
+                (scope, json.dumps(embedding), json.dumps(answer)),
+            )
+            self._conn.commit()
+            self._entries.setdefault(scope, []).append((embedding, answer))
@@ -5,9 +5,10 @@ This module provides utilities for interacting with Google Cloud Storage,
 including file operations and bucket management.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 
-from google.cloud import storage
+from google.api_core.exceptions import NotFound
 from loguru import logger
 
 
@@ -25,6 +26,10 @@ class GCSStorageClient:
     def client(self):
         """Lazy initialize GCS client."""
         if self._client is None:
+            # Imported here so that importing the module-level storage_client
+            # does not pull in the GCS SDK until the first request
+            from google.cloud import storage
+
             # Use anonymous client for public buckets
             self._client = storage.Client.create_anonymous_client()
             logger.debug("Initialized anonymous GCS client for public bucket")
@@ -49,6 +54,23 @@ class GCSStorageClient:
             logger.error(f"Error reading blob {blob_path}: {e}")
             raise
 
+    def try_get_text(self, blob_path: str) -> str | None:
+        """Get text content from a blob, or None if it does not exist.
+
+        Folds the existence check into the download so callers need a single
+        request instead of blob_exists() followed by get_text_from_blob().
+        """
+        try:
+            content = self.bucket.blob(blob_path).download_as_text()
+        except NotFound:
+            logger.debug(f"Blob not found: {blob_path}")
+            return None
+        except Exception as e:
+            logger.error(f"Error reading blob {blob_path}: {e}")
+            raise
+        logger.debug(f"Retrieved text from blob: {blob_path} ({len(content)} chars)")
+        return str(content)
+
     def get_bytes_from_blob(self, blob_path: str) -> bytes:
         """Get bytes content from a blob."""
         try:
@@ -60,6 +82,45 @@ class GCSStorageClient:
             logger.error(f"Error reading blob {blob_path}: {e}")
             raise
 
+    def get_bytes_range(self, blob_path: str, start: int, end: int) -> bytes:
+        """Get a byte range from a blob.
+
+        Args:
+            blob_path: Path of the blob within the bucket
+            start: First byte offset to read
+            end: Offset one past the last byte to read
+
+        Returns:
+            The requested bytes (may be shorter than requested for small blobs)
+        """
+        try:
+            blob = self.bucket.blob(blob_path)
+            # GCS treats `end` as inclusive
+            content = blob.download_as_bytes(start=start, end=end - 1)
+            logger.debug(f"Retrieved bytes [{start}:{end}) from blob: {blob_path} ({len(content)} bytes)")
+            return bytes(content)
+        except Exception as e:
+            logger.error(f"Error reading range from blob {blob_path}: {e}")
+            raise
+
+    def iter_blob_chunks(self, blob_path: str, chunk_size: int = 256 * 1024) -> Iterator[bytes]:
+        """Stream a blob's content in chunks as it is downloaded.
+
+        Args:
+            blob_path: Path of the blob within the bucket
+            chunk_size: Bytes per chunk (GCS requires a multiple of 256 KiB)
+
+        Yields:
+            Successive chunks of the blob content
+        """
+        blob = self.bucket.blob(blob_path)
+        total = 0
+        with blob.open("rb", chunk_size=chunk_size) as stream:
+            while chunk := stream.read(chunk_size):
+                total += len(chunk)
+                yield chunk
+        logger.debug(f"Streamed blob: {blob_path} ({total} bytes)")
+
     def blob_exists(self, blob_path: str) -> bool:
         """Check if a blob exists."""
         try:
@@ -101,21 +162,32 @@ class GCSStorageClient:
 
     def get_immediate_directories(self, prefix: str) -> list[str]:
         """Get immediate directories from prefix."""
+        return self.list_immediate_directories(prefix)
+
+    def list_immediate_directories(self, parent_prefix: str, name_prefix: str = "") -> list[str]:
+        """List immediate directories under a prefix, filtered server-side by name.
+
+        Uses a delimited listing so GCS only returns the common prefixes one level
+        below ``parent_prefix`` instead of every blob in the subtree.
+
+        Args:
+            parent_prefix: Parent "directory" prefix (should end with "/")
+            name_prefix: Only return directories whose name starts with this
+
+        Returns:
+            Sorted list of directory names (without the parent prefix)
+        """
         try:
-            dirs = set()
-            for blob in self.bucket.list_blobs(prefix=prefix):
-                # Get the part after the prefix
-                relative_path = blob.name[len(prefix) :]
-                # Only get the first directory name (before any slash)
-                if relative_path and "/" in relative_path:
-                    dir_name = relative_path.split("/")[0]
-                    dirs.add(dir_name)
-
-            directories = sorted(list(dirs))
-            logger.debug(f"Found {len(directories)} immediate directories in {prefix}: {directories}")
+            blobs = self.bucket.list_blobs(prefix=parent_prefix + name_prefix, delimiter="/")
+            # Prefixes are only populated once the iterator has been consumed
+            for _ in blobs:
+                pass
+
+            directories = sorted(p[len(parent_prefix) :].rstrip("/") for p in blobs.prefixes)
+            logger.debug(f"Found {len(directories)} immediate directories in {parent_prefix}: {directories}")
             return directories
         except Exception as e:
-            logger.error(f"Error getting immediate directories from {prefix}: {e}")
+            logger.error(f"Error getting immediate directories from {parent_prefix}: {e}")
             # Return empty list instead of raising to allow graceful degradation
             return []
 
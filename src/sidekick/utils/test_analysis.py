@@ -2,11 +2,13 @@
 Test analysis utilities for downloading and processing test artifacts.
 """
 
-import xml.etree.ElementTree as ET
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from loguru import logger
 
+from ._xml import ET, fromstring
 from .storage import storage_client
 
 
@@ -190,19 +192,20 @@ def extract_failed_testsuites(junit_path: Path) -> str:
             logger.warning(f"JUnit XML file {junit_path} does not appear to be XML")
             return f"JUnit XML file does not appear to be XML. Content: {xml_content.strip()[:200]}..."
 
-        root = ET.fromstring(xml_content)
+        root = fromstring(xml_content)
         testsuites = [root] if root.tag == "testsuite" else root.findall("testsuite")
 
         failed_testsuites = []
         for testsuite in testsuites:
-            failures = int(testsuite.get("failures", "0"))
-            errors = int(testsuite.get("errors", "0"))
+            attrs = testsuite.attrib
+            failures = int(attrs.get("failures") or 0)
+            errors = int(attrs.get("errors") or 0)
 
             if failures > 0 or errors > 0:
-                # Remove system-out elements to reduce noise
-                for element in testsuite.iter():
-                    system_outs = element.findall("system-out")
-                    for system_out in system_outs:
+                # Remove system-out elements to reduce noise. Scan children
+                # directly rather than running a findall() path query per node.
+                for element in list(testsuite.iter()):
+                    for system_out in [child for child in element if child.tag == "system-out"]:
                         element.remove(system_out)
 
                 failed_testsuites.append(ET.tostring(testsuite, encoding="unicode"))
@@ -217,6 +220,28 @@ def extract_failed_testsuites(junit_path: Path) -> str:
         return error_msg
 
 
+def extract_failed_testsuites_batch(junit_paths: list[Path], max_workers: int | None = None) -> list[str]:
+    """Extract failed test suites from several JUnit XML files.
+
+    XML parsing is CPU-bound, so multiple files are spread across worker
+    processes to avoid serializing on the GIL.
+
+    Args:
+        junit_paths: JUnit XML files to process
+        max_workers: Maximum number of worker processes (defaults to CPU count)
+
+    Returns:
+        Results of extract_failed_testsuites() in the same order as junit_paths
+    """
+    if len(junit_paths) < 2:
+        return [extract_failed_testsuites(path) for path in junit_paths]
+
+    workers = min(len(junit_paths), max_workers or os.cpu_count() or 1)
+    logger.debug(f"Extracting failed testsuites from {len(junit_paths)} files with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_failed_testsuites, junit_paths))
+
+
 def get_folder_structure(prefix: str) -> str:
     """Get the tree/folder structure output from a GCS prefix."""
     try:
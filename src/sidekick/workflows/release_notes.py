@@ -17,7 +17,8 @@ from rich import print
 from rich.panel import Panel
 from rich.pretty import Pretty
 
-from ..agents.jira_agent import JiraAgent
+from ..agents._shared import new_session_id
+from ..agents.jira_agent import TICKET_PROMPT, JiraAgent
 from ..tools.jira import parse_json_to_jira_issue
 
 
@@ -55,7 +56,7 @@ class ReleaseNotesGenerator:
 
     def _generate_session_id(self) -> str:
         """Generate a new session ID using UUID."""
-        return str(uuid.uuid4())
+        return new_session_id()
 
     def create_session(self, user_id: str | None = None) -> str:
         """
@@ -129,7 +130,7 @@ class ReleaseNotesGenerator:
 
                 # Ask the agent to fetch the ticket details
                 jira_response = await jira_agent.arun(
-                    f"Get detailed information for Jira ticket {ticket_id}",
+                    TICKET_PROMPT.format(ticket_id=ticket_id),
                     session_id=self._session_id,
                     user_id=self.user_id,
                 )
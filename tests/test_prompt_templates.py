@@ -37,6 +37,17 @@ class TestPromptTemplates:
         assert "agents.jira" in templates
         assert "agents.github" in templates
 
+    def test_prompt_registry_contains(self):
+        """Test membership checks cover file-backed and in-memory templates."""
+        registry = get_prompt_registry()
+
+        assert "agents.search" in registry
+        assert "agents.does_not_exist" not in registry
+
+        template = BasePromptTemplate(config=PromptConfig(name="in_memory"), template_content="Hi")
+        registry.register("tests.in_memory", template)
+        assert "tests.in_memory" in registry
+
     def test_search_agent_prompts(self):
         """Test SearchAgent uses prompt templates correctly."""
         agent = SearchAgent()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the shared agent session storage.
+
+This module tests the write-behind BatchingSqliteStorage and get_shared_storage.
+"""
+
+import sqlite3
+
+import pytest
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+from sidekick.agents import _storage
+from sidekick.agents._storage import BatchingSqliteStorage, get_shared_storage
+
+TABLE = "sessions"
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Path of an empty session database."""
+    return str(tmp_path / "sessions.db")
+
+
+@pytest.fixture
+def storage(db_file):
+    """Batching storage whose background writer waits long enough for the tests to look at the buffer."""
+    storage = BatchingSqliteStorage(table_name=TABLE, db_file=db_file, flush_interval=0.5)
+    yield storage
+    storage.close()
+
+
+def stored_session(db_file: str, session_id: str):
+    """Read a session straight from the database file, bypassing any buffer."""
+    return SqliteStorage(table_name=TABLE, db_file=db_file).read(session_id)
+
+
+class TestBatchingSqliteStorage:
+    """Test cases for BatchingSqliteStorage."""
+
+    def test_read_sees_buffered_session(self, storage, db_file):
+        """Test that a session is readable before it has been written to disk."""
+        session = AgentSession(session_id="s1", user_id="u1")
+        storage.upsert(session)
+
+        assert storage.read("s1") is session
+        assert storage.read("s1", user_id="u1") is session
+        assert stored_session(db_file, "s1") is None
+
+    def test_close_writes_buffered_session(self, storage, db_file):
+        """Test that close() writes pending sessions and stops the background writer."""
+        storage.upsert(AgentSession(session_id="s1", user_id="u1", session_data={"turns": 1}))
+        storage.close()
+
+        assert not storage._flush_thread.is_alive()
+        written = stored_session(db_file, "s1")
+        assert written is not None
+        assert written.session_data == {"turns": 1}
+
+    def test_delete_drops_pending_write(self, storage, db_file):
+        """Test that deleting a buffered session keeps it from being written later."""
+        storage.upsert(AgentSession(session_id="s1"))
+        storage.delete_session("s1")
+        storage.close()
+
+        assert storage.read("s1") is None
+        assert stored_session(db_file, "s1") is None
+
+
+class TestGetSharedStorage:
+    """Test cases for get_shared_storage."""
+
+    @pytest.fixture(autouse=True)
+    def empty_storage_cache(self, monkeypatch):
+        """Give each test its own storage cache and close the storages it creates."""
+        monkeypatch.setattr(_storage, "_STORAGE_CACHE", {})
+        yield
+        for storage in _storage._STORAGE_CACHE.values():
+            storage.close()
+
+    def test_one_instance_per_table(self, tmp_path):
+        """Test that storages are shared per database file and table."""
+        db_path = tmp_path / "sessions.db"
+        storage = get_shared_storage(db_path, "agent_sessions")
+
+        assert get_shared_storage(db_path, "agent_sessions") is storage
+        assert get_shared_storage(db_path, "other_sessions") is not storage
+        assert get_shared_storage(tmp_path / "other.db", "agent_sessions") is not storage
+
+    def test_uses_tuned_pooled_engine(self, tmp_path):
+        """Test that storages use the shared engine with the SQLite tuning applied."""
+        db_path = tmp_path / "sessions.db"
+        storage = get_shared_storage(db_path, "agent_sessions")
+
+        assert storage.db_engine is _storage._get_sqlite_engine(str(db_path))
+        assert storage.db_engine.pool.size() == _storage.SQLITE_POOL_SIZE
+        with storage.db_engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        with sqlite3.connect(db_path) as connection:
+            assert connection.execute("PRAGMA page_size").fetchone()[0] == _storage.SQLITE_PAGE_SIZE
+
+    def test_sessions_round_trip(self, tmp_path):
+        """Test that a session written through the shared engine can be read back after a flush."""
+        storage = get_shared_storage(tmp_path / "sessions.db", "agent_sessions")
+        storage.upsert(AgentSession(session_id="s1", session_data={"turns": 2}))
+        storage.flush()
+
+        assert storage.get_all_session_ids() == ["s1"]
+        assert storage.read("s1").session_data == {"turns": 2}
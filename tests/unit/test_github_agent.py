@@ -0,0 +1,33 @@
+"""
+Unit tests for the GitHub agent module.
+
+This module tests the rotation of GitHub access tokens.
+"""
+
+from sidekick.agents.github_agent import TokenRotator
+
+
+class TestTokenRotator:
+    """Test cases for TokenRotator."""
+
+    def test_unused_tokens_rotate(self):
+        """Test that tokens without a known rate limit are handed out round-robin."""
+        rotator = TokenRotator(["a", "b", "c"], remaining=lambda token: -1)
+        assert [rotator.next_token() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+
+    def test_equal_budgets_rotate(self):
+        """Test that tokens with the same remaining rate limit are handed out round-robin."""
+        rotator = TokenRotator(["a", "b"], remaining=lambda token: 100)
+        assert [rotator.next_token() for _ in range(4)] == ["a", "b", "a", "b"]
+
+    def test_prefers_most_remaining(self):
+        """Test that the token with the most remaining requests wins."""
+        remaining = {"a": 10, "b": 4000, "c": 20}
+        rotator = TokenRotator(["a", "b", "c"], remaining=remaining.__getitem__)
+        assert [rotator.next_token() for _ in range(3)] == ["b", "b", "b"]
+
+    def test_unused_token_counts_as_full_budget(self):
+        """Test that a token that has not been used beats a partly used one."""
+        remaining = {"a": 4999, "b": -1}
+        rotator = TokenRotator(["a", "b"], remaining=remaining.__getitem__)
+        assert rotator.next_token() == "b"
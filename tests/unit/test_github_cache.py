@@ -0,0 +1,76 @@
+"""
+Unit tests for the GitHub ETag cache.
+
+This module tests the conditional GET wrapper installed around PyGithub's requester.
+"""
+
+from types import SimpleNamespace
+
+from sidekick.utils.github_cache import GitHubETagCache, _conditional_request_json
+
+URL = "https://api.github.com/repos/owner/repo"
+
+
+class FakeRequestJson:
+    """Stand-in for Requester.requestJson answering 304 when the ETag matches."""
+
+    def __init__(self):
+        self.sent_headers: list[dict] = []
+
+    def __call__(self, requester, verb, url, parameters=None, headers=None, input=None):
+        headers = headers or {}
+        self.sent_headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {"x-ratelimit-remaining": "4999"}, ""
+        return 200, {"etag": '"v1"', "x-ratelimit-remaining": "4998"}, '{"name": "repo"}'
+
+
+def make_requester(token: str) -> SimpleNamespace:
+    """Create a requester authenticated with a token, like github.Auth.Token."""
+    return SimpleNamespace(auth=SimpleNamespace(token_type="token", token=token))
+
+
+class TestConditionalRequestJson:
+    """Test cases for the conditional requestJson wrapper."""
+
+    def test_not_modified_returns_cached_body(self, tmp_path):
+        """Test that a 304 answer is turned into the cached 200 response."""
+        original = FakeRequestJson()
+        request_json = _conditional_request_json(original, GitHubETagCache(tmp_path / "etags.db"))
+        requester = make_requester("token-a")
+
+        assert request_json(requester, "GET", URL)[0] == 200
+        status, headers, body = request_json(requester, "GET", URL)
+
+        assert original.sent_headers[1]["If-None-Match"] == '"v1"'
+        assert status == 200
+        assert body == '{"name": "repo"}'
+        assert headers["x-ratelimit-remaining"] == "4999"
+
+    def test_not_shared_between_tokens(self, tmp_path):
+        """Test that a response cached for one token is not revalidated with another."""
+        original = FakeRequestJson()
+        request_json = _conditional_request_json(original, GitHubETagCache(tmp_path / "etags.db"))
+
+        request_json(make_requester("token-a"), "GET", URL)
+        request_json(make_requester("token-b"), "GET", URL)
+        request_json(make_requester("token-a"), "GET", URL, headers={"Authorization": "token token-c"})
+
+        assert ["If-None-Match" in headers for headers in original.sent_headers] == [False, False, False]
+
+    def test_token_not_stored(self):
+        """Test that the cache key holds a fingerprint instead of the token."""
+        key = GitHubETagCache.make_key(URL, {"page": 1}, "token secret-token")
+        assert "secret-token" not in key
+        assert key != GitHubETagCache.make_key(URL, {"page": 1}, "token other-token")
+
+    def test_writes_bypass_cache(self, tmp_path):
+        """Test that non-GET requests are sent unchanged and not cached."""
+        original = FakeRequestJson()
+        request_json = _conditional_request_json(original, GitHubETagCache(tmp_path / "etags.db"))
+        requester = make_requester("token-a")
+
+        request_json(requester, "PATCH", URL, input={"name": "renamed"})
+        request_json(requester, "GET", URL)
+
+        assert original.sent_headers == [{}, {}]
@@ -0,0 +1,67 @@
+"""
+Unit tests for the GitHub GraphQL toolkit.
+
+This module tests that the raw graphql_query tool only runs read-only documents.
+"""
+
+import json
+from unittest.mock import Mock
+
+from sidekick.tools.github_graphql import GitHubGraphQLTools, _definition_types
+
+
+class TestDefinitionTypes:
+    """Test cases for _definition_types."""
+
+    def test_named_and_anonymous_queries(self):
+        """Test that named, anonymous and fragment definitions are reported."""
+        document = """
+        query Viewer($n: Int = 1) { viewer { login } }
+        { rateLimit { remaining } }
+        fragment user on User { login }
+        """
+        assert _definition_types(document) == ["query", "query", "fragment"]
+
+    def test_mutation_detected(self):
+        """Test that a mutation after a query is reported."""
+        document = 'query { viewer { login } } mutation { addStar(input: {starrableId: "x"}) { clientMutationId } }'
+        assert _definition_types(document) == ["query", "mutation"]
+
+    def test_strings_and_comments_ignored(self):
+        """Test that keywords and braces in strings and comments are not definitions."""
+        document = """
+        # mutation { deleteRepository }
+        query { search(query: "mutation { }", type: ISSUE, first: 1) { issueCount } }
+        """
+        assert _definition_types(document) == ["query"]
+
+
+class TestGraphQLQuery:
+    """Test cases for GitHubGraphQLTools.graphql_query."""
+
+    def _tools(self):
+        tools = GitHubGraphQLTools(access_token="token")
+        tools._session = Mock()
+        tools._session.post.return_value.json.return_value = {"data": {}}
+        return tools
+
+    def test_rejects_mutation(self):
+        """Test that mutations are rejected without contacting GitHub."""
+        tools = self._tools()
+        result = json.loads(tools.graphql_query('mutation { addStar(input: {starrableId: "x"}) { clientMutationId } }'))
+        assert "mutation" in result["error"]
+        tools._session.post.assert_not_called()
+
+    def test_rejects_subscription_and_empty_document(self):
+        """Test that subscriptions and empty documents are rejected."""
+        tools = self._tools()
+        assert "error" in json.loads(tools.graphql_query("subscription { x }"))
+        assert "error" in json.loads(tools.graphql_query("  # nothing here"))
+        tools._session.post.assert_not_called()
+
+    def test_runs_query(self):
+        """Test that read-only queries are sent with their variables."""
+        tools = self._tools()
+        result = json.loads(tools.graphql_query("query($n: Int!) { viewer { login } }", '{"n": 1}'))
+        assert result == {"data": {}}
+        assert tools._session.post.call_args.kwargs["json"]["variables"] == {"n": 1}
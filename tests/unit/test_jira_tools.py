@@ -0,0 +1,85 @@
+"""
+Unit tests for the Jira toolkit.
+
+This module tests the cache of issues fetched by JiraTools.get_issue.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from sidekick.tools import jira as jira_tools
+from sidekick.tools.jira import JiraTools, clear_issue_cache
+
+
+class FakeJira:
+    """Jira client stub counting the issues it is asked for."""
+
+    def __init__(self):
+        self.fetched: list[str] = []
+
+    def issue(self, issue_key, expand=None):
+        self.fetched.append(issue_key)
+        return SimpleNamespace(key=issue_key, fields=SimpleNamespace())
+
+
+@pytest.fixture(autouse=True)
+def empty_issue_cache():
+    """Start and end every test with an empty issue cache."""
+    clear_issue_cache()
+    yield
+    clear_issue_cache()
+
+
+def make_tools(server_url: str, client: FakeJira) -> JiraTools:
+    """Create a toolkit already connected to a Jira server."""
+    tools = JiraTools()
+    tools._jira_client = client
+    tools._server_url = server_url
+    tools._format_issue_details = lambda issue: SimpleNamespace(
+        model_dump=lambda: {"key": issue.key}, pull_requests=[], comments=[]
+    )
+    return tools
+
+
+class TestIssueCache:
+    """Test cases for the get_issue cache."""
+
+    def test_repeated_issue_is_cached(self):
+        """Test that an issue is fetched once within the TTL."""
+        client = FakeJira()
+        tools = make_tools("https://jira.example.com", client)
+        assert tools.get_issue("PROJ-1") == tools.get_issue("PROJ-1")
+        assert client.fetched == ["PROJ-1"]
+
+    def test_keyed_by_server(self):
+        """Test that the same issue key on another server is fetched from that server."""
+        first, second = FakeJira(), FakeJira()
+        make_tools("https://jira.example.com", first).get_issue("PROJ-1")
+        make_tools("https://jira.other.example.com", second).get_issue("PROJ-1")
+        assert first.fetched == ["PROJ-1"]
+        assert second.fetched == ["PROJ-1"]
+
+    def test_least_recently_used_evicted(self, monkeypatch):
+        """Test that the cache is bounded and drops the least recently used issue."""
+        monkeypatch.setattr(jira_tools, "ISSUE_CACHE_SIZE", 2)
+        client = FakeJira()
+        tools = make_tools("https://jira.example.com", client)
+        tools.get_issue("PROJ-1")
+        tools.get_issue("PROJ-2")
+        tools.get_issue("PROJ-1")
+        tools.get_issue("PROJ-3")
+        assert len(jira_tools._issue_cache) == 2
+
+        tools.get_issue("PROJ-1")
+        tools.get_issue("PROJ-2")
+        assert client.fetched == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-2"]
+
+    def test_clear_issue_cache(self):
+        """Test that clearing one issue forces it to be fetched again."""
+        client = FakeJira()
+        tools = make_tools("https://jira.example.com", client)
+        tools.get_issue("PROJ-1")
+        clear_issue_cache("PROJ-1")
+        tools.get_issue("PROJ-1")
+        assert client.fetched == ["PROJ-1", "PROJ-1"]
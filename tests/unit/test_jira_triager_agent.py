@@ -0,0 +1,270 @@
+"""
+Unit tests for the Jira triager agent.
+
+This module tests the triages answered from the team configuration, the
+in-memory and semantic caches of triage results, the sharing of the Agno
+agent between triagers and the Gemini batch triage.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from sidekick.agents import jira_triager_agent
+from sidekick.agents.jira_triager_agent import (
+    COMPONENT_MAP_CONFIDENCE,
+    JiraTriagerAgent,
+    TriageRecommendation,
+    clear_config_cache,
+)
+from sidekick.utils import jira_client_utils
+from sidekick.utils.semantic_cache import SemanticCache
+
+
+def make_triager() -> JiraTriagerAgent:
+    """Create a triager without a knowledge base or semantic cache."""
+    return JiraTriagerAgent(jira_knowledge_manager=None, semantic_cache_path=None)
+
+
+@pytest.fixture
+def team_config(monkeypatch):
+    """Configure two teams with their members and components."""
+    monkeypatch.setenv("ALLOWED_TEAMS", json.dumps(["Security", "Platform"]))
+    monkeypatch.setenv("TEAM_ASSIGNEE_MAP", json.dumps({"Security": ["alice"], "Platform": ["bob"]}))
+    monkeypatch.setenv("COMPONENT_TEAM_MAP", json.dumps({"Security": ["Authentication"], "Platform": ["Catalog"]}))
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.mark.usefixtures("team_config")
+class TestConfiguredTriage:
+    """Test cases for triages answered from the team configuration."""
+
+    @pytest.fixture
+    def triager(self, monkeypatch):
+        """Triager that fails the test if it asks the model."""
+        monkeypatch.setattr(jira_client_utils, "get_project_component_names", lambda project_key: ["Catalog"])
+        triager = make_triager()
+        triager._copy_agent = lambda response_model: pytest.fail("the model was asked")
+        return triager
+
+    def test_team_from_assignee(self, triager):
+        """Test that the assignee's team is returned with full confidence."""
+        ticket = {"title": "Login fails", "assignee": " alice ", "component": "Catalog"}
+        assert triager.triage_ticket(ticket) == {"team": "Security", "confidence": 1.0}
+
+    def test_team_from_component(self, triager):
+        """Test that the only team of the ticket's component is returned with lower confidence."""
+        ticket = {"title": "Catalog is empty", "component": "Catalog"}
+        assert triager.triage_ticket(ticket) == {"team": "Platform", "confidence": COMPONENT_MAP_CONFIDENCE}
+
+    def test_component_from_team(self, triager):
+        """Test that the only component of the ticket's team is returned if the project has it."""
+        ticket = {"title": "Catalog is empty", "team": "Platform"}
+        assert triager.triage_ticket(ticket) == {"component": "Catalog", "confidence": COMPONENT_MAP_CONFIDENCE}
+
+    def test_unmapped_ticket(self, triager):
+        """Test that tickets the configuration does not determine are left to the model."""
+        assert triager._configured_triage({"assignee": "carol", "component": "Docs"}, ["team"]) is None
+        assert triager._configured_triage({"team": "Security"}, ["component"]) is None
+        assert triager._configured_triage({"assignee": "alice"}, ["team", "component"]) is None
+
+    def test_strict_llm(self, triager):
+        """Test that strict_llm always leaves the triage to the model."""
+        triager.strict_llm = True
+        assert triager._configured_triage({"assignee": "alice", "component": "Catalog"}, ["team"]) is None
+
+
+class TestLookupTriage:
+    """Test cases for JiraTriagerAgent._lookup_triage."""
+
+    def test_repeated_ticket_is_cached(self):
+        """Test that a stored triage is returned for the same ticket."""
+        triager = make_triager()
+        ticket = {"title": "Login fails", "description": "500 on /login", "component": "Authentication"}
+        cached, store = triager._lookup_triage(ticket, ["team"])
+        assert cached is None
+        store({"team": "Security", "confidence": 0.9})
+
+        cached, _ = triager._lookup_triage(dict(ticket), ["team"])
+        assert cached == {"team": "Security", "confidence": 0.9}
+
+    def test_list_component(self):
+        """Test that a ticket whose component is a list of components can be looked up and stored."""
+        triager = make_triager()
+        ticket = {"title": "Login fails", "description": "500 on /login", "component": ["RBAC", "Authentication"]}
+        cached, store = triager._lookup_triage(ticket, ["team"])
+        assert cached is None
+        store({"team": "Security", "confidence": 0.9})
+
+        reordered = dict(ticket, component=["Authentication", "RBAC"])
+        cached, _ = triager._lookup_triage(reordered, ["team"])
+        assert cached == {"team": "Security", "confidence": 0.9}
+
+    def test_other_missing_fields_miss(self):
+        """Test that a triage is not reused when other fields are missing."""
+        triager = make_triager()
+        ticket = {"title": "Login fails", "description": "500 on /login"}
+        _, store = triager._lookup_triage(ticket, ["team"])
+        store({"team": "Security", "confidence": 0.9})
+
+        cached, _ = triager._lookup_triage(ticket, ["team", "component"])
+        assert cached is None
+
+
+class TestSemanticLookup:
+    """Test cases for JiraTriagerAgent._semantic_lookup."""
+
+    def test_scoped_by_team(self, tmp_path):
+        """Test that a near-duplicate of a ticket with another team is not reused."""
+        triager = make_triager()
+        triager._semantic_cache = SemanticCache(tmp_path / "cache.db", embed=lambda text: [1.0, 0.0])
+        ticket = {"title": "Login fails", "description": "500 on /login", "team": "Security", "component": ["RBAC"]}
+        _, store = triager._semantic_lookup(ticket, ["assignee"])
+        store({"assignee": "alice", "confidence": 0.9})
+
+        cached, _ = triager._semantic_lookup(dict(ticket), ["assignee"])
+        assert cached == {"assignee": "alice", "confidence": 0.9}
+        cached, _ = triager._semantic_lookup(dict(ticket, team="Platform"), ["assignee"])
+        assert cached is None
+
+
+class FakeAgent:
+    """Agno agent stub recording the copies made of it and the runs made on them."""
+
+    def __init__(self, storage=None, response_model=None, original=None):
+        self.storage = storage
+        self.response_model = response_model
+        self.original = original
+        self.copies: list[FakeAgent] = []
+        self.runs: list[str] = []
+
+    def deep_copy(self, update):
+        copy = FakeAgent(original=self, **update)
+        self.copies.append(copy)
+        return copy
+
+    def run(self, prompt, **kwargs):
+        self.runs.append(prompt)
+        return SimpleNamespace(content=TriageRecommendation(confidence=0.5))
+
+
+class TestSharedAgent:
+    """Test cases for the Agno agent shared between triagers."""
+
+    def test_triages_run_on_copies(self, tmp_path, monkeypatch):
+        """Test that two triagers share one cached agent but each triage runs on its own copy."""
+        storage_path = tmp_path / "sessions.db"
+        shared = FakeAgent()
+        monkeypatch.setitem(jira_triager_agent._AGENT_CACHE, storage_path.resolve(), shared)
+        knowledge = SimpleNamespace(load_issues=lambda recreate: None)
+        ticket = {"title": "Login fails", "description": "500 on /login"}
+
+        triagers = []
+        for _ in range(2):
+            triager = JiraTriagerAgent(
+                jira_knowledge_manager=knowledge, storage_path=storage_path, semantic_cache_path=None, strict_llm=True
+            )
+            triager._storage = object()
+            triager._build_triage_prompt = lambda current_ticket, missing_fields: "prompt"
+            assert triager.triage_ticket(ticket) == {"confidence": 0.5}
+            triagers.append(triager)
+
+        assert all(triager._agent is shared for triager in triagers)
+        assert shared.runs == []
+        assert len(shared.copies) == 2
+        assert all(copy.runs == ["prompt"] and copy.response_model is TriageRecommendation for copy in shared.copies)
+
+
+class FakeBatches:
+    """Gemini batches API stub returning a prepared job."""
+
+    def __init__(self, job=None):
+        self.job = job
+        self.created: list[dict] = []
+
+    def create(self, model, src, config):
+        self.created.append({"model": model, "src": src, "config": config})
+        return SimpleNamespace(name="batches/job-1")
+
+    def get(self, name):
+        return self.job
+
+
+def make_batch_triager(batches: FakeBatches) -> JiraTriagerAgent:
+    """Create a triager whose agent's model talks to a batches stub."""
+    triager = JiraTriagerAgent(
+        jira_knowledge_manager=SimpleNamespace(load_issues=lambda recreate: None), semantic_cache_path=None
+    )
+    triager._agent = SimpleNamespace(model=SimpleNamespace(get_client=lambda: SimpleNamespace(batches=batches)))
+    triager._build_triage_prompt = lambda current_ticket, missing_fields: f"triage {current_ticket['key']}"
+    return triager
+
+
+def succeeded_job(*inlined_responses) -> SimpleNamespace:
+    """Job in the succeeded state with the given inlined responses."""
+    return SimpleNamespace(
+        state=SimpleNamespace(name="JOB_STATE_SUCCEEDED"),
+        error=None,
+        dest=SimpleNamespace(inlined_responses=list(inlined_responses)),
+    )
+
+
+def inlined(text: str | None = None, error: str | None = None) -> SimpleNamespace:
+    """Inlined batch response holding either a reply text or an error."""
+    return SimpleNamespace(response=SimpleNamespace(text=text) if text is not None else None, error=error)
+
+
+BATCH_TICKETS = [
+    {"key": "A-1", "title": "Login fails", "component": "Authentication"},
+    {"key": "A-2", "title": "Fully triaged", "team": "Platform", "component": "Catalog"},
+    {"key": "A-3", "title": "Catalog is empty", "component": "Catalog"},
+    {"key": "A-4", "title": "Token expired", "component": "Authentication"},
+]
+
+
+@pytest.mark.usefixtures("team_config")
+class TestBatchTriage:
+    """Test cases for submit_batch_triage and poll_batch_triage."""
+
+    def test_submit_skips_triaged_tickets(self):
+        """Test that only tickets with a missing field become requests."""
+        batches = FakeBatches()
+        assert make_batch_triager(batches).submit_batch_triage(BATCH_TICKETS) == "batches/job-1"
+
+        prompts = [request["contents"][0]["parts"][0]["text"] for request in batches.created[0]["src"]]
+        assert prompts == ["triage A-1", "triage A-3", "triage A-4"]
+
+    def test_running_job_returns_none(self):
+        """Test that a job that has not finished yields no results."""
+        job = SimpleNamespace(state=SimpleNamespace(name="JOB_STATE_RUNNING"), error=None, dest=None)
+        assert make_batch_triager(FakeBatches(job)).poll_batch_triage("batches/job-1", BATCH_TICKETS) is None
+
+    def test_failed_job_raises(self):
+        """Test that a failed job raises with its error."""
+        job = SimpleNamespace(state=SimpleNamespace(name="JOB_STATE_FAILED"), error="quota exceeded", dest=None)
+        with pytest.raises(RuntimeError, match="quota exceeded"):
+            make_batch_triager(FakeBatches(job)).poll_batch_triage("batches/job-1", BATCH_TICKETS)
+
+    def test_mismatched_tickets_raise(self):
+        """Test that tickets not matching the job's requests are rejected."""
+        job = succeeded_job(inlined('{"team": "Security", "confidence": 0.9}'))
+        with pytest.raises(ValueError, match="do not match"):
+            make_batch_triager(FakeBatches(job)).poll_batch_triage("batches/job-1", BATCH_TICKETS)
+
+    def test_results_land_on_their_tickets(self):
+        """Test that successes and errors are mapped back to their tickets by position."""
+        job = succeeded_job(
+            inlined('{"team": "Security", "confidence": 0.9}'),
+            inlined(error="internal error"),
+            inlined('{"team": "Platform", "component": "Catalog", "confidence": 0.7}'),
+        )
+        results = make_batch_triager(FakeBatches(job)).poll_batch_triage("batches/job-1", BATCH_TICKETS)
+
+        assert results[0] == {"team": "Security", "confidence": 0.9}
+        assert results[1] == {}
+        assert isinstance(results[2], RuntimeError)
+        assert "internal error" in str(results[2])
+        assert results[3] == {"team": "Platform", "confidence": 0.7}
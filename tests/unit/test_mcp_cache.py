@@ -0,0 +1,106 @@
+"""
+Unit tests for the MCP tool schema cache.
+
+This module tests the cache keys and the on-disk cache used by CachedMCPTools.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import Tool
+
+from sidekick.tools.mcp_cache import CachedMCPTools, tool_cache_key
+
+SEARCH_TOOL = Tool(
+    name="jira_search",
+    description="Search Jira issues",
+    inputSchema={"type": "object", "properties": {"jql": {"type": "string"}}},
+)
+
+
+class FakeSession:
+    """MCP client session stub counting handshakes and tool listings."""
+
+    def __init__(self, tools: list[Tool]):
+        self.tools = tools
+        self.initialized = 0
+        self.listed = 0
+
+    async def initialize(self):
+        self.initialized += 1
+
+    async def list_tools(self):
+        self.listed += 1
+        return SimpleNamespace(tools=self.tools)
+
+
+def make_tools(session: FakeSession, cache_path, cache_ttl_seconds: float = 3600) -> CachedMCPTools:
+    """Create a toolkit on a session, caching under a fixed key."""
+    return CachedMCPTools(session=session, cache_key="key", cache_path=cache_path, cache_ttl_seconds=cache_ttl_seconds)
+
+
+class TestToolCacheKey:
+    """Test cases for tool_cache_key."""
+
+    def test_key_follows_configuration(self):
+        """Test that the key changes with the command, env and included tools."""
+        key = tool_cache_key("uvx mcp-atlassian", {"JIRA_URL": "https://jira.example.com"}, ["jira_search"])
+
+        assert key == tool_cache_key("uvx mcp-atlassian", {"JIRA_URL": "https://jira.example.com"}, ["jira_search"])
+        assert key != tool_cache_key("uvx mcp-atlassian@2", {"JIRA_URL": "https://jira.example.com"}, ["jira_search"])
+        assert key != tool_cache_key("uvx mcp-atlassian", {"JIRA_URL": "https://jira.other.com"}, ["jira_search"])
+        assert key != tool_cache_key("uvx mcp-atlassian", {"JIRA_URL": "https://jira.example.com"}, None)
+
+    def test_env_not_in_key(self):
+        """Test that credentials in the env are hashed rather than written into the key."""
+        assert "secret-token" not in tool_cache_key("uvx mcp-atlassian", {"JIRA_PERSONAL_TOKEN": "secret-token"}, None)
+
+
+class TestCachedMCPTools:
+    """Test cases for CachedMCPTools.initialize."""
+
+    @pytest.mark.asyncio
+    async def test_cached_entry_skips_list_tools(self, tmp_path):
+        """Test that a second toolkit registers the cached tools without listing them."""
+        cache_path = tmp_path / "mcp_tool_cache.json"
+        await make_tools(FakeSession([SEARCH_TOOL]), cache_path).initialize()
+
+        session = FakeSession([])
+        tools = make_tools(session, cache_path)
+        await tools.initialize()
+
+        assert session.listed == 0
+        assert session.initialized == 1
+        assert list(tools.functions) == ["jira_search"]
+        assert tools.functions["jira_search"].parameters == SEARCH_TOOL.inputSchema
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_not_reused(self, tmp_path):
+        """Test that tools are listed again once the cached entry has expired."""
+        cache_path = tmp_path / "mcp_tool_cache.json"
+        await make_tools(FakeSession([SEARCH_TOOL]), cache_path).initialize()
+        cache = json.loads(cache_path.read_text())
+        cache["key"]["saved_at"] = time.time() - 7200
+        cache_path.write_text(json.dumps(cache))
+
+        session = FakeSession([SEARCH_TOOL])
+        await make_tools(session, cache_path).initialize()
+
+        assert session.listed == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_tool_list_not_cached(self, tmp_path):
+        """Test that an empty listing is not saved and an empty cached list is not reused."""
+        cache_path = tmp_path / "mcp_tool_cache.json"
+        await make_tools(FakeSession([]), cache_path).initialize()
+        assert not cache_path.exists()
+
+        cache_path.write_text(json.dumps({"key": {"saved_at": time.time(), "tools": []}}))
+        session = FakeSession([SEARCH_TOOL])
+        tools = make_tools(session, cache_path)
+        await tools.initialize()
+
+        assert session.listed == 1
+        assert list(tools.functions) == ["jira_search"]